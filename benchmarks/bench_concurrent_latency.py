@@ -0,0 +1,86 @@
+"""
+Concurrent request latency while a large batch is being parsed
+
+Runs the function a service's /process endpoint hands to run_batched
+(clean-data's parse_lines, process-data's classify_logs with the live ignore
+rules) on a large backfill batch while a probe coroutine stands in for
+concurrent small requests such as /health. Each probe measures how late the
+event loop let it run. The inline mode parses everything
+on the loop (the old behaviour), the pool mode uses the size-aware dispatcher.
+
+Usage:
+    python benchmarks/bench_concurrent_latency.py --service clean-data --lines 50000
+    python benchmarks/bench_concurrent_latency.py --service process-data --lines 50000
+"""
+import argparse
+import asyncio
+import time
+from functools import partial
+from common import use_service, sample_lines, sample_logs, percentile
+
+PROBE_INTERVAL = 0.005
+
+async def probe(stop: asyncio.Event, lags: list):
+    """Record how late each scheduled wake-up runs"""
+    while not stop.is_set():
+        expected = time.perf_counter() + PROBE_INTERVAL
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append((time.perf_counter() - expected) * 1000)
+
+async def run_mode(dispatch, func, items: list, inline_limit: int, batches: int) -> dict:
+    stop = asyncio.Event()
+    lags = []
+    probe_task = asyncio.create_task(probe(stop, lags))
+    await asyncio.sleep(PROBE_INTERVAL * 2)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(dispatch.run_batched(func, items, inline_limit=inline_limit) for _ in range(batches))
+    )
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await probe_task
+    return {
+        "elapsed_s": elapsed,
+        "results": sum(len(r) for r in results),
+        "probe_p50_ms": percentile(lags, 50),
+        "probe_p99_ms": percentile(lags, 99),
+        "probe_max_ms": max(lags) if lags else 0.0
+    }
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--service', choices=['clean-data', 'process-data'], default='clean-data')
+    parser.add_argument('--lines', type=int, default=50000, help='items per batch')
+    parser.add_argument('--batches', type=int, default=2, help='concurrent large batches')
+    args = parser.parse_args()
+
+    use_service(args.service)
+    import dispatch
+    from processor import LogProcessor
+
+    # The same functions the /process endpoints hand to run_batched
+    if args.service == 'clean-data':
+        func, items = LogProcessor.parse_lines, sample_lines(args.lines)
+    else:
+        from events import LogRecord
+        from config import live_config
+        func = partial(LogProcessor.classify_logs, ignored_tribes=live_config.current.ignored_tribes)
+        items = [LogRecord(**log) for log in sample_logs(args.lines)]
+
+    # Warm up the pool so process start-up is not billed to the first batch
+    await dispatch.run_batched(func, items[:dispatch.BATCH_CHUNK_SIZE * 2], inline_limit=0)
+
+    print(f"{args.service}: {args.batches} concurrent batches of {args.lines} items, "
+          f"pool={dispatch.WORKER_POOL_SIZE} chunk={dispatch.BATCH_CHUNK_SIZE}")
+    for mode, inline_limit in (('inline', len(items) + 1), ('pool', dispatch.INLINE_BATCH_LIMIT)):
+        stats = await run_mode(dispatch, func, items, inline_limit, args.batches)
+        print(f"  {mode:<6} elapsed={stats['elapsed_s']:.3f}s results={stats['results']} "
+              f"probe p50={stats['probe_p50_ms']:.2f}ms p99={stats['probe_p99_ms']:.2f}ms "
+              f"max={stats['probe_max_ms']:.2f}ms")
+
+    dispatch.shutdown_executor()
+
+if __name__ == '__main__':
+    asyncio.run(main())
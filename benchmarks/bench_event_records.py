@@ -0,0 +1,79 @@
+"""
+Memory and throughput of the slotted event records in process-data
+
+Memory compares 10k classified events held as plain dicts (the previous
+representation) with 10k slotted Event records. Throughput runs the
+request path of process-data: validate a /process body into LogRecords,
+classify them with classify_logs and the live ignore rules, mine the logs no
+format matched and serialize the alert request for alert-service.
+
+Usage:
+    python benchmarks/bench_event_records.py --events 10000
+"""
+import argparse
+import logging
+import time
+import tracemalloc
+from common import use_service, sample_logs
+
+def measure_memory(build) -> int:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    events = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del events
+    return after - before
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--events', type=int, default=10000)
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    use_service('process-data')
+    logging.disable(logging.CRITICAL)
+    from events import Event, LogRecord
+    from processor import LogProcessor
+    from config import live_config
+    from api import LogRequest, AlertRequest, template_miner
+
+    ignored_tribes = live_config.current.ignored_tribes
+
+    def classify(logs: list) -> list:
+        # As process_logs in api.py: events become alerts, the rest is mined
+        alerts = []
+        for result in LogProcessor.classify_logs(logs, ignored_tribes=ignored_tribes):
+            if isinstance(result, Event):
+                alerts.append(result)
+            else:
+                template_miner.add(result)
+        return alerts
+
+    payload = {"logs": sample_logs(args.events)}
+    events = classify(LogRequest.model_validate(payload).logs)
+    # Plain-text copies so both representations start from unshared strings
+    rows = [
+        (e.event_type.value, e.timestamp, e.map, e.victim, e.perpetrator, e.perpetrator_tribe)
+        for e in events
+    ]
+    keys = ("event_type", "timestamp", "map", "victim", "perpetrator", "perpetrator_tribe")
+
+    dict_bytes = measure_memory(lambda: [dict(zip(keys, row)) for row in rows])
+    record_bytes = measure_memory(lambda: [type(events[0])(*row) for row in rows])
+    scale = 10000 / len(rows)
+    print(f"memory per 10k events: dict={dict_bytes * scale / 1024:.1f} KiB "
+          f"slotted={record_bytes * scale / 1024:.1f} KiB")
+
+    best = float('inf')
+    for _ in range(args.rounds):
+        start = time.perf_counter()
+        request = LogRequest.model_validate(payload)
+        alerts = classify(request.logs)
+        AlertRequest.model_construct(alerts=alerts).model_dump_json()
+        best = min(best, time.perf_counter() - start)
+    print(f"throughput: {args.events / best:,.0f} logs/s "
+          f"({len(alerts)} alerts, best of {args.rounds}, {LogRecord.__name__} records)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+"""
+Gateway event processing cost of the discord bot: lean vs default client
+
+Replays a gateway event stream through the client's parsers without a
+network connection and reports events/sec and RSS as the stream progresses.
+Forwarding to clean-data is replaced by a counter so only gateway handling
+is measured. Each mode runs in its own process so RSS figures don't mix.
+
+The stream is a JSONL file of gateway dispatches ({"t": ..., "d": ...}). When
+no file is given a synthetic guild with busy channels is generated, with
+--target-share of the messages in the monitored channel.
+
+Usage:
+    python benchmarks/bench_gateway.py --messages 200000
+    python benchmarks/bench_gateway.py --events recorded_gateway.jsonl --mode lean
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import subprocess
+import sys
+import time
+from common import use_service, sample_lines
+
+GUILD_ID = 1000
+TARGET_CHANNEL = 2000
+BOT_USER = {"id": "999", "username": "alert-bot", "discriminator": "0", "avatar": None, "bot": True}
+
+def rss_mb() -> float:
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024 / 1024
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def synthetic_stream(messages: int, target_share: float, seed: int = 0):
+    rng = random.Random(seed)
+    channels = [TARGET_CHANNEL] + list(range(2001, 2050))
+    users = [
+        {"id": str(10000 + i), "username": f"user{i}", "discriminator": "0", "avatar": None}
+        for i in range(500)
+    ]
+    yield {"t": "GUILD_CREATE", "d": {
+        "id": str(GUILD_ID), "name": "Tribe", "member_count": len(users), "roles": [],
+        "emojis": [], "stickers": [], "features": [], "threads": [], "stage_instances": [],
+        "guild_scheduled_events": [], "presences": [], "voice_states": [],
+        "channels": [{"id": str(c), "type": 0, "name": f"channel-{c}", "position": i,
+                      "permission_overwrites": []} for i, c in enumerate(channels)],
+        "members": [{"user": u, "roles": [], "joined_at": "2024-01-01T00:00:00+00:00",
+                     "deaf": False, "mute": False, "flags": 0} for u in users[:100]],
+    }}
+    lines = sample_lines(1000, seed)
+    for i in range(messages):
+        channel = TARGET_CHANNEL if rng.random() < target_share else rng.choice(channels[1:])
+        user = rng.choice(users)
+        yield {"t": "MESSAGE_CREATE", "d": {
+            "id": str(10 ** 17 + i), "channel_id": str(channel), "guild_id": str(GUILD_ID),
+            "author": user, "member": {"roles": [], "joined_at": "2024-01-01T00:00:00+00:00",
+                                       "deaf": False, "mute": False, "flags": 0},
+            "content": '\n'.join(rng.sample(lines, 5)), "timestamp": "2025-01-01T00:00:00+00:00",
+            "edited_timestamp": None, "tts": False, "mention_everyone": False, "mentions": [],
+            "mention_roles": [], "attachments": [], "embeds": [], "pinned": False, "type": 0,
+        }}
+
+def recorded_stream(path: str):
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+async def replay(mode: str, stream, sample_every: int) -> dict:
+    os.environ['LEAN_GATEWAY'] = 'true' if mode == 'lean' else 'false'
+    os.environ.setdefault('CHANNEL_ID', str(TARGET_CHANNEL))
+    use_service('discord-bot')
+    import discord
+    import main
+    logging.disable(logging.CRITICAL)
+
+    class BenchBot(main.WebhookBot):
+        forwarded = 0
+
+        async def setup_hook(self):
+            if main.LEAN_GATEWAY:
+                self.install_channel_filter()
+
+        async def forward_content(self, channel_id, content):
+            self.forwarded += 1
+            return True
+
+    if mode == 'lean':
+        options = main.lean_client_options()
+    else:
+        intents = discord.Intents.default()
+        intents.message_content = True
+        options = {'intents': intents}
+
+    client = BenchBot(**options)
+    await client._async_setup_hook()
+    await client.setup_hook()
+    client._connection.user = discord.ClientUser(state=client._connection, data=BOT_USER)
+    parsers = client._connection.parsers
+
+    samples = []
+    events = 0
+    start = time.perf_counter()
+    for event in stream:
+        parse = parsers.get(event["t"])
+        if parse:
+            parse(event["d"])
+        events += 1
+        if events % sample_every == 0:
+            # Let dispatched handlers run so their work is included
+            await asyncio.sleep(0)
+            samples.append((events, round(rss_mb(), 1)))
+    await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+    return {
+        "mode": mode,
+        "events": events,
+        "events_per_sec": round(events / elapsed),
+        "forwarded": client.forwarded,
+        "rss_mb": samples
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--mode', choices=['lean', 'default'])
+    parser.add_argument('--events', help='recorded gateway stream (JSONL)')
+    parser.add_argument('--messages', type=int, default=100000)
+    parser.add_argument('--target-share', type=float, default=0.01)
+    parser.add_argument('--samples', type=int, default=5, help='RSS samples over the run')
+    args = parser.parse_args()
+
+    if args.mode is None:
+        for mode in ('default', 'lean'):
+            subprocess.run([sys.executable, *sys.argv, '--mode', mode], check=True)
+        return
+
+    stream = recorded_stream(args.events) if args.events else synthetic_stream(args.messages, args.target_share)
+    sample_every = max(1, args.messages // args.samples)
+    result = asyncio.run(replay(args.mode, stream, sample_every))
+    print(f"{result['mode']:<7} {result['events_per_sec']:>8,} events/s  "
+          f"forwarded={result['forwarded']}  "
+          f"rss_mb={' '.join(f'{n}:{mb}' for n, mb in result['rss_mb'])}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""
+process-data throughput when scaling from 1 to N partitioned workers
+
+Cleans a synthetic log stream, splits each request-sized batch by map with
+clean-data's partitioner and hands every partition to its own process-data
+worker process, one request at a time and in order, the way the partitioned
+replicas receive them. Reports throughput per worker count and checks
+that every map was handled by exactly one worker with its events in order.
+
+Usage:
+    python benchmarks/bench_partitioning.py --max-workers 4 --logs 100000
+"""
+import argparse
+import importlib.util
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from common import ROOT_DIR, sample_logs, use_service
+
+def load_partitioner():
+    # clean-data and process-data share module names, load the partitioner by path
+    path = os.path.join(ROOT_DIR, 'src', 'clean-data', 'app', 'partition.py')
+    spec = importlib.util.spec_from_file_location('clean_data_partition', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def init_worker():
+    use_service('process-data')
+    logging.disable(logging.CRITICAL)
+
+def run_partition(requests: list) -> list:
+    """Process the requests of one replica in order, returning (map, timestamp) per alert"""
+    from events import Event, LogRecord
+    from processor import LogProcessor
+    handled = []
+    for logs in requests:
+        records = [LogRecord(**log) for log in logs]
+        for result in LogProcessor.classify_logs(records):
+            if isinstance(result, Event):
+                handled.append((result.map, result.timestamp))
+    return handled
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--logs', type=int, default=100000)
+    parser.add_argument('--request-size', type=int, default=100)
+    args = parser.parse_args()
+
+    partitioner = load_partitioner()
+    logs = sample_logs(args.logs)
+    # Timestamps increase along the stream so per-map order can be verified
+    for i, log in enumerate(logs):
+        log["timestamp"] = time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(1_700_000_000 + i))
+
+    class Entry:
+        __slots__ = ('map', 'log')
+
+        def __init__(self, log):
+            self.map = log["map"]
+            self.log = log
+
+    for workers in range(1, args.max_workers + 1):
+        per_worker = [[] for _ in range(workers)]
+        for start in range(0, len(logs), args.request_size):
+            batch = [Entry(log) for log in logs[start:start + args.request_size]]
+            for index, entries in partitioner.partition_by_map(batch, workers).items():
+                per_worker[index].append([entry.log for entry in entries])
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+            # Warm up the workers so interpreter start-up is not measured
+            list(pool.map(run_partition, [[]] * workers))
+            started = time.perf_counter()
+            results = list(pool.map(run_partition, per_worker))
+            elapsed = time.perf_counter() - started
+
+        maps_per_worker = [{m for m, _ in handled} for handled in results]
+        maps_split = sum(len(a & b) for i, a in enumerate(maps_per_worker) for b in maps_per_worker[i + 1:])
+        in_order = all(
+            [ts for m, ts in handled if m == map_name] == sorted(ts for m, ts in handled if m == map_name)
+            for handled, maps in zip(results, maps_per_worker) for map_name in maps
+        )
+        busiest = max(sum(len(r) for r in requests) for requests in per_worker)
+        print(f"workers={workers}  {args.logs / elapsed:>10,.0f} logs/s  "
+              f"busiest worker={busiest} logs  maps split={maps_split}  per-map order kept={in_order}")
+
+if __name__ == '__main__':
+    main()
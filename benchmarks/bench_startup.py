@@ -0,0 +1,130 @@
+"""
+Service start-up profile: import time and time to first request
+
+For every service this runs the entrypoint module under `python -X importtime`
+and reports the total import time plus the slowest imports made directly by
+the entrypoint. For the HTTP services it then starts uvicorn and measures the
+wall time from spawning the process until /health first answers. Results can be written as JSON so
+they can be tracked per service over time.
+
+Usage:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --service alert-service --runs 5 --output startup.json
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from common import SERVICES, service_app_dir
+
+ENTRYPOINTS = {
+    'clean-data': ('api', 'api:app'),
+    'process-data': ('api', 'api:app'),
+    'alert-service': ('app.api', 'app.api:app'),
+    'discord-bot': ('main', None),
+}
+
+# Placeholder settings so the config modules import outside of docker
+SERVICE_ENV = {
+    'DISCORD_TOKEN': 'benchmark',
+    'CHANNEL_ID': '1',
+    'DISCORD_WEBHOOK_URL': 'http://127.0.0.1:9/webhook',
+}
+
+def service_env(service: str) -> dict:
+    env = dict(os.environ, **SERVICE_ENV)
+    env['PYTHONPATH'] = service_app_dir(service)
+    return env
+
+def import_profile(service: str, workdir: str) -> dict:
+    module, _ = ENTRYPOINTS[service]
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=workdir, env=service_env(service), capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+
+    total_us = 0
+    children = []
+    entry_imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        total_us += int(self_us)
+        # Nested imports are printed before their parent, indented two spaces per level
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if depth == 1:
+            children.append((int(cumulative_us), name.strip()))
+        elif depth == 0:
+            if name.strip() == module:
+                entry_imports = children
+            children = []
+    entry_imports.sort(reverse=True)
+    return {
+        "import_ms": round(total_us / 1000, 1),
+        "top_imports_ms": {name: round(us / 1000, 1) for us, name in entry_imports[:10]}
+    }
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def time_to_first_request(service: str, workdir: str, timeout: float = 30.0) -> float:
+    _, app_path = ENTRYPOINTS[service]
+    port = free_port()
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'uvicorn', app_path, '--host', '127.0.0.1', '--port', str(port)],
+        cwd=workdir, env=service_env(service),
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            try:
+                with urllib.request.urlopen(f'http://127.0.0.1:{port}/health', timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start
+            except OSError:
+                time.sleep(0.01)
+        raise RuntimeError(f"{service} did not answer /health within {timeout}s")
+    finally:
+        process.terminate()
+        process.wait()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--service', choices=SERVICES, action='append')
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for service in args.service or SERVICES:
+            profile = import_profile(service, workdir)
+            if ENTRYPOINTS[service][1]:
+                samples = [time_to_first_request(service, workdir) for _ in range(args.runs)]
+                profile["first_request_ms"] = round(statistics.median(samples) * 1000, 1)
+            results[service] = profile
+
+            first_request = profile.get('first_request_ms')
+            print(f"{service}: import={profile['import_ms']}ms "
+                  f"first_request={f'{first_request}ms' if first_request else 'n/a'}")
+            for name, ms in profile["top_imports_ms"].items():
+                print(f"    {ms:>8.1f}ms  {name}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+"""
+Latency and throughput of a pipeline hop over TCP vs a Unix domain socket
+
+Starts process-data once on a TCP port and once on a Unix socket, then posts
+small /process batches to each with clean-data's session pool, the client
+side of that hop. Every tribe is ignored so no alerts are forwarded and the
+numbers only cover the hop itself. Reports sequential latency percentiles and
+the request rate with --concurrency requests in flight.
+
+Both servers run on this host, over loopback TCP rather than the docker
+bridge, so the TCP figures are a lower bound for the containerised pipeline.
+
+Usage:
+    python benchmarks/bench_transport.py --requests 2000 --concurrency 32
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from common import TRIBES, percentile, sample_logs, service_app_dir, use_service
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def start_server(workdir: str, bind: list) -> subprocess.Popen:
+    # Several ignored tribes can only be listed in the config file
+    config_file = os.path.join(workdir, 'pipeline.json')
+    with open(config_file, 'w', encoding='utf-8') as f:
+        json.dump({"IGNORED_TRIBE": TRIBES}, f)
+    env = dict(
+        os.environ,
+        PYTHONPATH=service_app_dir('process-data'),
+        LOG_LEVEL='WARNING',
+        CONFIG_FILE=config_file
+    )
+    return subprocess.Popen(
+        [sys.executable, '-m', 'uvicorn', 'api:app', '--log-level', 'warning', '--no-access-log', *bind],
+        cwd=workdir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+
+async def wait_ready(sessions, url: str, timeout: float = 30.0):
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            session, target = sessions.resolve(url.rsplit('/', 1)[0] + '/health')
+            async with session.get(target) as response:
+                if response.status == 200:
+                    return
+        except OSError:
+            pass
+        await asyncio.sleep(0.05)
+    raise RuntimeError(f"process-data did not answer on {url} within {timeout}s")
+
+async def post(sessions, url: str, body: str) -> float:
+    session, target = sessions.resolve(url)
+    started = time.perf_counter()
+    async with session.post(target, data=body, headers={'Content-Type': 'application/json'}) as response:
+        await response.read()
+        if response.status != 200:
+            raise RuntimeError(f"{url} returned {response.status}")
+    return (time.perf_counter() - started) * 1000
+
+async def measure(sessions, url: str, body: str, requests: int, concurrency: int) -> dict:
+    # Warm up the connection pool and the server
+    for _ in range(50):
+        await post(sessions, url, body)
+
+    latencies = [await post(sessions, url, body) for _ in range(requests)]
+
+    remaining = iter(range(requests))
+
+    async def worker():
+        for _ in remaining:
+            await post(sessions, url, body)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {
+        "p50_ms": percentile(latencies, 50),
+        "p99_ms": percentile(latencies, 99),
+        "requests_per_sec": requests / elapsed
+    }
+
+async def run(args) -> dict:
+    use_service('clean-data')
+    from transport import SessionPool
+
+    body = json.dumps({"logs": sample_logs(args.logs)})
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        socket_path = os.path.join(workdir, 'process-data.sock')
+        port = free_port()
+        targets = {
+            'tcp': (f'http://127.0.0.1:{port}/process', ['--host', '127.0.0.1', '--port', str(port)]),
+            'unix': (f'unix://{socket_path}/process', ['--uds', socket_path]),
+        }
+        for transport, (url, bind) in targets.items():
+            server = start_server(workdir, bind)
+            sessions = SessionPool()
+            try:
+                await wait_ready(sessions, url)
+                results[transport] = await measure(sessions, url, body, args.requests, args.concurrency)
+            finally:
+                await sessions.close()
+                server.terminate()
+                server.wait()
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--logs', type=int, default=5, help='logs per request')
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    print(f"process-data /process, {args.logs} logs per request, {args.requests} requests")
+    for transport, stats in results.items():
+        print(f"  {transport:<5} p50={stats['p50_ms']:.3f}ms p99={stats['p99_ms']:.3f}ms "
+              f"{stats['requests_per_sec']:>8,.0f} req/s at concurrency {args.concurrency}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""Shared helpers for the pipeline benchmarks"""
+import os
+import random
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SERVICES = ('clean-data', 'process-data', 'alert-service', 'discord-bot')
+
+MAPS = ['The Island', 'Scorched Earth', 'Aberration', 'Extinction', 'Ragnarok', 'Valguero']
+TRIBES = ['Raiders', 'Night Crew', 'Alpha Tribe', 'Wanderers']
+STRUCTURES = ['Metal Wall', 'Metal Foundation', 'Vault', 'Heavy Auto Turret', 'Tek Generator']
+
+def service_app_dir(service: str) -> str:
+    """Return the app directory of a service"""
+    if service == 'alert-service':
+        return os.path.join(ROOT_DIR, 'src', service)
+    return os.path.join(ROOT_DIR, 'src', service, 'app')
+
+def use_service(service: str):
+    """
+    Make a service importable the way its container runs it
+
+    Services share module names (config, processor, ...), so a benchmark
+    process can only load one of them at a time.
+    """
+    if service not in SERVICES:
+        raise ValueError(f"Unknown service: {service}")
+    sys.path.insert(0, service_app_dir(service))
+
+def sample_message(rng: random.Random) -> str:
+    """Build a random tribe log message in one of the known formats"""
+    killer = f"Player{rng.randint(1, 500)} - Lvl {rng.randint(1, 150)} ({rng.choice(TRIBES)})"
+    kind = rng.randrange(3)
+    if kind == 0:
+        return f"{killer} destroyed your '{rng.choice(STRUCTURES)}'!"
+    if kind == 1:
+        return f"Tribemember Member{rng.randint(1, 50)} - Lvl {rng.randint(1, 150)} was killed by {killer}!"
+    return f"Your Dino{rng.randint(1, 900)} - Lvl {rng.randint(1, 300)} (Rex) was killed by {killer}!"
+
+def sample_lines(count: int, seed: int = 0) -> list:
+    """Build raw tribe log lines as posted in the Discord channel"""
+    rng = random.Random(seed)
+    return [
+        f"[{rng.randint(1, 12)}-{rng.randint(1, 28)} {rng.randint(0, 23)}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}]"
+        f"[{rng.choice(MAPS)}] {sample_message(rng)}"
+        for _ in range(count)
+    ]
+
+def sample_logs(count: int, seed: int = 0) -> list:
+    """Build cleaned log entries as sent from clean-data to process-data"""
+    rng = random.Random(seed)
+    return [
+        {
+            "timestamp": f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} {rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}",
+            "map": rng.choice(MAPS),
+            "message": sample_message(rng)
+        }
+        for _ in range(count)
+    ]
+
+def percentile(values: list, pct: float) -> float:
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
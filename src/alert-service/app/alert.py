@@ -1,45 +1,61 @@
+import asyncio
 from app.models.alert import Alert
-from .webhook import WebhookService
-import logging
-
-logger = logging.getLogger(__name__)
+from app.config import ALERT_SINKS, SINK_QUEUE_SIZE, SINK_BATCH_SIZE, live_config
+from app.sinks import SinkDispatcher, load_sinks
+from .delivery import DeliveryOwner
 
 class AlertService:
     def __init__(self):
-        self.webhook_service = WebhookService()
+        config = live_config.current
+        self.owners = {}
+        self.started = False
+        for url in (config.webhook_url, *config.webhook_routes.values()):
+            self._owner(url)
+        self.sinks = SinkDispatcher(load_sinks(ALERT_SINKS), SINK_QUEUE_SIZE, SINK_BATCH_SIZE)
+
+    async def start(self):
+        """Start one delivery worker per webhook and the additional sinks"""
+        await self.sinks.start()
+        for owner in self.owners.values():
+            owner.start()
+        self.started = True
+
+    async def close(self):
+        """Drain and stop the delivery workers, then drain the additional sinks"""
+        await asyncio.gather(*(owner.close() for owner in self.owners.values()))
+        await self.sinks.close()
+
+    def _owner(self, url: str) -> DeliveryOwner:
+        """Delivery owner of a webhook, created when a reload adds the url"""
+        owner = self.owners.get(url)
+        if owner is None:
+            owner = self.owners[url] = DeliveryOwner(url)
+            if self.started:
+                owner.start()
+        return owner
 
-    async def process_alert(self, alert: Alert) -> dict:
+    def owner_for(self, alert: Alert) -> DeliveryOwner:
+        # Owners of urls removed by a reload are kept, they just stop receiving alerts
+        config = live_config.current
+        return self._owner(config.webhook_routes.get(alert.map.lower(), config.webhook_url))
+
+    def lane_stats(self) -> dict:
+        """Per-lane queue stats of every webhook, numbered in configuration order"""
+        return {
+            f"webhook_{index}": owner.scheduler.stats()
+            for index, owner in enumerate(self.owners.values())
+        }
+
+    def queue_alert(self, alert: Alert) -> asyncio.Future:
         """
-        Process and send an alert
-        
-        Args:
-            alert: The alert to process and send
-            
+        Queue an alert for the additional sinks and for its webhook
+
         Returns:
-            dict: Processing result including status
+            Future: Resolves with the delivery result once the webhook's
+            worker has sent the alert
         """
-        try:
-            # Convert alert to dict for processing
-            alert_data = alert.model_dump()
-            
-            # Send to Discord
-            response = await self.webhook_service.send_webhook(alert_data)
-            
-            if response["success"]:
-                logger.info(
-                    f"Successfully processed {alert.event_type} alert"
-                )
-            else:
-                logger.warning(
-                    f"Alert processed but sending failed: {response['message']}"
-                )
-            
-            return response
-            
-        except Exception as e:
-            logger.error(f"Error processing alert: {str(e)}")
-            return {
-                "status": "error",
-                "message": f"Alert processing failed: {str(e)}",
-                "success": False
-            }
\ No newline at end of file
+        # Queue for the additional sinks, they never delay Discord
+        self.sinks.publish(alert)
+
+        # Queue for the map's webhook, delivered by its worker
+        return self.owner_for(alert).submit(alert)
@@ -1,18 +1,18 @@
+# Imported first so the startup profile covers the remaining imports
+from app.startup import profiler, STARTUP_PROFILE
 import os
-import sys
+import asyncio
 import logging
 from logging.handlers import TimedRotatingFileHandler
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from pydantic import BaseModel
 from typing import List
-
-# Add the current directory to Python path
-current_dir = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, current_dir)
+from contextlib import asynccontextmanager
 
 # Import models and services
-from app.models.alert import Alert, EventType
+from app.models.alert import Alert
 from app.alert import AlertService
+from app.config import live_config
 
 # Configure logging
 def configure_logging():
@@ -45,42 +45,82 @@ def configure_logging():
     return logger
 
 logger = configure_logging()
+profiler.mark('imports')
+
+# Service instance, built in the lifespan hook
+alert_service: AlertService = None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global alert_service
+    alert_service = AlertService()
+    await alert_service.start()
+    config_task = asyncio.create_task(live_config.watch())
+    profiler.mark('ready')
+    if STARTUP_PROFILE:
+        logger.info(f"Startup profile: {profiler.summary()}")
+    yield
+    config_task.cancel()
+    await alert_service.close()
 
 # Create the FastAPI app
 app = FastAPI(
     title="Game Alert Webhook Service",
     description="Service for sending game alerts to Discord",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
+if STARTUP_PROFILE:
+    @app.middleware("http")
+    async def profile_first_request(request: Request, call_next):
+        response = await call_next(request)
+        if 'first_request' not in profiler.phases:
+            profiler.mark('first_request')
+            logger.info(f"Startup profile: {profiler.summary()}")
+        return response
+
 # Define the request model
 class AlertRequest(BaseModel):
     alerts: List[Alert]
 
-# Create service instances
-alert_service = AlertService()
-
-@app.post("/alert")
+@app.post("/alert", status_code=202)
 async def process_alerts(request: AlertRequest):
     """
-    Endpoint to receive and process game alerts for Discord delivery
+    Endpoint to receive game alerts for Discord delivery
+
+    Alerts are accepted once queued, delivery happens in the background at
+    the pace of each webhook's rate limit, so a raid never holds the caller
     """
     try:
-        results = []
+        # Queue every alert at once so priority lanes can reorder the batch
         for alert in request.alerts:
-            logger.info(f"Processing {alert.event_type} alert")
-            result = await alert_service.process_alert(alert)
-            results.append(result)
+            logger.info(f"Queueing {alert.event_type} alert")
+            alert_service.queue_alert(alert)
 
         return {
-            "status": "success",
-            "processed": len(results),
-            "results": results
+            "status": "accepted",
+            "queued": len(request.alerts)
         }
     except Exception as e:
-        logger.error(f"Failed to process alerts: {str(e)}")
+        logger.error(f"Failed to queue alerts: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/lanes")
+async def lane_stats():
+    """Queue depth and queue latency of each delivery priority lane, per webhook"""
+    return alert_service.lane_stats()
+
+@app.get("/sinks")
+async def sink_stats():
+    """Delivery counters of the additional alert sinks"""
+    return alert_service.sinks.stats()
+
+@app.get("/config/version")
+async def config_version():
+    """Version of the live configuration snapshot"""
+    return live_config.version_info()
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
@@ -0,0 +1,88 @@
+import os
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping
+from dotenv import load_dotenv
+from app.live_config import ConfigWatcher
+from app.templates import EmbedTemplate, ALERT_FOOTER, compile_templates
+
+# Load environment variables
+load_dotenv()
+
+# Discord Configuration
+DISCORD_WEBHOOK_URL = os.getenv('DISCORD_WEBHOOK_URL')
+
+# Optional per-map webhooks, comma separated "Map Name=webhook url" pairs.
+# Maps without a route use DISCORD_WEBHOOK_URL
+def parse_routes(routes) -> dict:
+    if isinstance(routes, str):
+        routes = dict(item.split('=', 1) for item in routes.split(',') if '=' in item)
+    return {map_name.strip().lower(): url.strip() for map_name, url in routes.items()}
+
+DISCORD_WEBHOOK_ROUTES = parse_routes(os.getenv('DISCORD_WEBHOOK_ROUTES', ''))
+
+# Delivery priority per event type, lower is served first. Lane 0 is reserved
+# for STRUCTURE_DESTROYED alerts whose victim is listed in CRITICAL_STRUCTURES
+ALERT_PRIORITIES = {
+    name.strip(): int(priority)
+    for name, priority in (
+        item.split('=') for item in os.getenv(
+            'ALERT_PRIORITIES',
+            'STRUCTURE_DESTROYED=1,MEMBER_KILLED=1,CREATURE_KILLED=2'
+        ).split(',') if item.strip()
+    )
+}
+CRITICAL_STRUCTURES = [name.strip() for name in os.getenv('CRITICAL_STRUCTURES', '').split(',') if name.strip()]
+# Seconds an alert may wait before its lane is served ahead of higher priorities
+LANE_MAX_WAIT = float(os.getenv('LANE_MAX_WAIT', '30'))
+# Seconds to keep delivering queued alerts on shutdown, alerts are accepted
+# before delivery so whatever is left after this is lost. Keep it below the
+# container stop grace period
+DRAIN_TIMEOUT = float(os.getenv('DRAIN_TIMEOUT', '8'))
+
+# Additional alert sinks, comma separated (file, http, smtp, stdout)
+ALERT_SINKS = [name.strip() for name in os.getenv('ALERT_SINKS', '').split(',') if name.strip()]
+SINK_QUEUE_SIZE = int(os.getenv('SINK_QUEUE_SIZE', '1000'))
+SINK_BATCH_SIZE = int(os.getenv('SINK_BATCH_SIZE', '50'))
+
+# File sink
+SINK_FILE_PATH = os.getenv('SINK_FILE_PATH', 'logs/alerts.jsonl')
+SINK_FILE_MAX_BYTES = int(os.getenv('SINK_FILE_MAX_BYTES', str(10 * 1024 * 1024)))
+SINK_FILE_BACKUP_COUNT = int(os.getenv('SINK_FILE_BACKUP_COUNT', '5'))
+
+# HTTP sink
+SINK_HTTP_URL = os.getenv('SINK_HTTP_URL', '')
+SINK_HTTP_TIMEOUT = float(os.getenv('SINK_HTTP_TIMEOUT', '10'))
+
+# SMTP sink
+SINK_SMTP_HOST = os.getenv('SINK_SMTP_HOST', '')
+SINK_SMTP_PORT = int(os.getenv('SINK_SMTP_PORT', '587'))
+SINK_SMTP_USER = os.getenv('SINK_SMTP_USER', '')
+SINK_SMTP_PASSWORD = os.getenv('SINK_SMTP_PASSWORD', '')
+SINK_SMTP_STARTTLS = os.getenv('SINK_SMTP_STARTTLS', 'true').lower() == 'true'
+SINK_SMTP_FROM = os.getenv('SINK_SMTP_FROM', '')
+SINK_SMTP_TO = [addr.strip() for addr in os.getenv('SINK_SMTP_TO', '').split(',') if addr.strip()]
+
+
+# Hot-reloadable Configuration
+# JSON file with overrides keyed like the environment variables above, polled
+# for changes and swapped in without a restart. Reloadable keys:
+# DISCORD_WEBHOOK_URL, DISCORD_WEBHOOK_ROUTES (string or object),
+# ALERT_FORMATS (per event type format overrides) and ALERT_FOOTER
+CONFIG_FILE = os.getenv('CONFIG_FILE', 'config/pipeline.json')
+CONFIG_POLL_INTERVAL = float(os.getenv('CONFIG_POLL_INTERVAL', '5'))
+
+@dataclass(frozen=True)
+class LiveConfig:
+    webhook_url: str
+    webhook_routes: Mapping[str, str]  # Lowercased map name to webhook url
+    templates: Mapping[str, EmbedTemplate]  # Compiled embed per event type
+
+def build_live_config(overrides: dict) -> LiveConfig:
+    return LiveConfig(
+        webhook_url=overrides.get('DISCORD_WEBHOOK_URL') or DISCORD_WEBHOOK_URL,
+        webhook_routes=MappingProxyType(parse_routes(overrides.get('DISCORD_WEBHOOK_ROUTES', DISCORD_WEBHOOK_ROUTES))),
+        templates=compile_templates(overrides.get('ALERT_FORMATS'), overrides.get('ALERT_FOOTER', ALERT_FOOTER))
+    )
+
+live_config = ConfigWatcher(CONFIG_FILE, build_live_config, CONFIG_POLL_INTERVAL)
@@ -0,0 +1,100 @@
+import asyncio
+import logging
+from app.models.alert import Alert, EventType
+from app.config import ALERT_PRIORITIES, CRITICAL_STRUCTURES, LANE_MAX_WAIT, DRAIN_TIMEOUT
+from app.scheduler import PriorityScheduler
+from .webhook import WebhookService
+
+logger = logging.getLogger(__name__)
+
+class DeliveryOwner:
+    """
+    Sole sender for one Discord webhook
+
+    Each webhook has its own rate limit, so every webhook gets exactly one
+    priority queue and one delivery worker. Alerts for the same webhook are
+    sent one at a time, while different webhooks deliver in parallel.
+    """
+
+    def __init__(self, webhook_url: str):
+        self.webhook_service = WebhookService(webhook_url)
+        self.scheduler = PriorityScheduler(
+            {EventType(name): priority for name, priority in ALERT_PRIORITIES.items()},
+            critical_structures=CRITICAL_STRUCTURES,
+            max_wait=LANE_MAX_WAIT
+        )
+        self.task = None
+        self.sending = False
+
+    @property
+    def name(self) -> str:
+        # Webhook id only, the token after it is a secret
+        return self.webhook_service.webhook_url.rsplit('/', 1)[0]
+
+    def start(self):
+        self.task = asyncio.create_task(self._deliver())
+
+    async def drain(self):
+        """Wait until every queued alert has been sent"""
+        while self.scheduler.pending() or self.sending:
+            await asyncio.sleep(0.05)
+
+    async def close(self, timeout: float = DRAIN_TIMEOUT):
+        """Deliver the queued alerts for up to timeout seconds, then stop"""
+        if self.task:
+            try:
+                await asyncio.wait_for(self.drain(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            self.task.cancel()
+            await asyncio.gather(self.task, return_exceptions=True)
+        dropped = self.scheduler.pending()
+        if dropped:
+            logger.error(f"Shutting down with {dropped} undelivered alerts for webhook {self.name}")
+        self.scheduler.clear({
+            "status": "error",
+            "message": "Alert service shutting down",
+            "success": False
+        })
+
+    def submit(self, alert: Alert) -> asyncio.Future:
+        """Queue an alert, the returned future resolves with its delivery result"""
+        return self.scheduler.submit(alert)
+
+    async def _deliver(self):
+        """Send queued alerts to Discord one at a time, highest priority first"""
+        while True:
+            item = await self.scheduler.next()
+            _, alert, _ = item
+            self.sending = True
+            try:
+                response = await self.webhook_service.send_webhook(alert)
+            except asyncio.CancelledError:
+                # Back in the queue so shutdown counts it as undelivered
+                self.scheduler.requeue(item)
+                raise
+            except Exception as e:
+                response = {
+                    "status": "error",
+                    "message": f"Alert processing failed: {str(e)}",
+                    "success": False
+                }
+            finally:
+                self.sending = False
+
+            retry_after = response.get("retry_after")
+            if retry_after is not None:
+                # Put it back and let priority decide what is sent once the limit resets
+                self.scheduler.requeue(item)
+                await asyncio.sleep(retry_after)
+                continue
+
+            if response["success"]:
+                logger.info(
+                    f"Successfully processed {alert.event_type} alert"
+                )
+            else:
+                logger.warning(
+                    f"Alert processed but sending failed: {response['message']}"
+                )
+            self.scheduler.complete(item, response)
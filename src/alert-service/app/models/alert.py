@@ -1,4 +1,5 @@
-from pydantic import BaseModel, Field
+import sys
+from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime
 
@@ -8,11 +9,17 @@ class EventType(str, Enum):
     MEMBER_KILLED = "MEMBER_KILLED"
     CREATURE_KILLED = "CREATURE_KILLED"
 
-class Alert(BaseModel):
+@dataclass(slots=True)
+class Alert:
     """Model for game alerts"""
     event_type: EventType
     timestamp: datetime
-    map: str = Field(..., description="Game map where the event occurred")
-    victim: str = Field(..., description="The destroyed structure/killed member/creature")
-    perpetrator: str = Field(..., description="Who caused the event")
-    perpetrator_tribe: str = Field(..., description="Tribe of the perpetrator")
\ No newline at end of file
+    map: str  # Game map where the event occurred
+    victim: str  # The destroyed structure/killed member/creature
+    perpetrator: str  # Who caused the event
+    perpetrator_tribe: str  # Tribe of the perpetrator
+
+    def __post_init__(self):
+        # Map and tribe names repeat across alerts, share one string each
+        self.map = sys.intern(self.map)
+        self.perpetrator_tribe = sys.intern(self.perpetrator_tribe)
@@ -0,0 +1,134 @@
+import asyncio
+import time
+import logging
+from collections import deque
+from typing import Dict, Iterable, Tuple
+from app.models.alert import Alert, EventType
+
+logger = logging.getLogger(__name__)
+
+# Lane used for alerts whose victim is a configured critical structure
+CRITICAL_PRIORITY = 0
+
+class Lane:
+    """FIFO queue of alerts sharing a priority, with queue latency stats"""
+
+    def __init__(self, priority: int):
+        self.priority = priority
+        self.items: deque = deque()
+        self.waits: deque = deque(maxlen=1000)
+        self.delivered = 0
+        self.max_wait = 0.0
+
+    def head_wait(self, now: float) -> float:
+        return now - self.items[0][0] if self.items else 0.0
+
+    def record_wait(self, wait: float):
+        self.delivered += 1
+        self.waits.append(wait)
+        self.max_wait = max(self.max_wait, wait)
+
+    def stats(self) -> dict:
+        waits = sorted(self.waits)
+
+        def pct(p: float) -> float:
+            if not waits:
+                return 0.0
+            return round(waits[min(len(waits) - 1, int(p * len(waits)))] * 1000, 1)
+
+        return {
+            "queued": len(self.items),
+            "delivered": self.delivered,
+            "wait_p50_ms": pct(0.50),
+            "wait_p99_ms": pct(0.99),
+            "wait_max_ms": round(self.max_wait * 1000, 1)
+        }
+
+class PriorityScheduler:
+    """
+    Multi-lane alert queue
+
+    Alerts are served from the lowest-numbered non-empty lane. To keep low
+    priority lanes from starving, a lane whose oldest alert has waited longer
+    than max_wait is served first, oldest such alert winning.
+    """
+
+    def __init__(
+        self,
+        priorities: Dict[EventType, int],
+        critical_structures: Iterable[str] = (),
+        max_wait: float = 30.0
+    ):
+        self.priorities = priorities
+        self.critical_structures = frozenset(name.lower() for name in critical_structures)
+        self.max_wait = max_wait
+        self.lanes: Dict[int, Lane] = {}
+        for priority in sorted({CRITICAL_PRIORITY, *priorities.values()}):
+            self.lanes[priority] = Lane(priority)
+        self.available = asyncio.Event()
+
+    def priority_for(self, alert: Alert) -> int:
+        if (
+            alert.event_type == EventType.STRUCTURE_DESTROYED
+            and alert.victim.lower() in self.critical_structures
+        ):
+            return CRITICAL_PRIORITY
+        return self.priorities.get(alert.event_type, max(self.lanes))
+
+    def submit(self, alert: Alert) -> asyncio.Future:
+        """Queue an alert, the returned future resolves with its delivery result"""
+        future = asyncio.get_running_loop().create_future()
+        self.lanes[self.priority_for(alert)].items.append((time.monotonic(), alert, future))
+        self.available.set()
+        return future
+
+    def requeue(self, item: Tuple[float, Alert, asyncio.Future]):
+        """Put an item back at the front of its lane, keeping its original wait"""
+        self.lanes[self.priority_for(item[1])].items.appendleft(item)
+        self.available.set()
+
+    def _pick_lane(self) -> Lane:
+        now = time.monotonic()
+        starved = [
+            lane for lane in self.lanes.values()
+            if lane.items and lane.head_wait(now) > self.max_wait
+        ]
+        if starved:
+            return max(starved, key=lambda lane: lane.head_wait(now))
+        return next(lane for lane in self.lanes.values() if lane.items)
+
+    async def next(self) -> Tuple[float, Alert, asyncio.Future]:
+        """Wait for the next alert to deliver"""
+        while not any(lane.items for lane in self.lanes.values()):
+            self.available.clear()
+            await self.available.wait()
+        return self._pick_lane().items.popleft()
+
+    def complete(self, item: Tuple[float, Alert, asyncio.Future], result: dict):
+        """Record the queue latency of a delivered item and resolve its future"""
+        self.lanes[self.priority_for(item[1])].record_wait(time.monotonic() - item[0])
+        if not item[2].done():
+            item[2].set_result(result)
+
+    def pending(self) -> int:
+        """Number of alerts queued in every lane"""
+        return sum(len(lane.items) for lane in self.lanes.values())
+
+    def clear(self, result: dict):
+        """Drop every queued item, resolving its future with the given result"""
+        for lane in self.lanes.values():
+            while lane.items:
+                future = lane.items.popleft()[2]
+                if not future.done():
+                    future.set_result(result)
+
+    def stats(self) -> dict:
+        lanes = {}
+        for priority, lane in self.lanes.items():
+            event_types = [
+                event_type.value for event_type, p in self.priorities.items() if p == priority
+            ]
+            if priority == CRITICAL_PRIORITY:
+                event_types.append("critical structures")
+            lanes[f"lane_{priority}"] = {"event_types": event_types, **lane.stats()}
+        return lanes
@@ -0,0 +1,33 @@
+import importlib
+import logging
+from typing import List
+from .base import AlertSink
+from .dispatcher import SinkDispatcher
+
+logger = logging.getLogger(__name__)
+
+# Sink name -> "module:class", imported only when the sink is configured
+SINK_TYPES = {
+    "file": "app.sinks.file_sink:FileSink",
+    "http": "app.sinks.http_sink:HttpSink",
+    "smtp": "app.sinks.smtp_sink:SmtpSink",
+    "stdout": "app.sinks.stdout_sink:StdoutSink",
+}
+
+def load_sinks(names: List[str]) -> List[AlertSink]:
+    """Instantiate the named sinks, skipping unknown or misconfigured ones"""
+    sinks = []
+    for name in names:
+        target = SINK_TYPES.get(name)
+        if not target:
+            logger.error(f"Unknown alert sink: {name}")
+            continue
+        module_name, class_name = target.split(':')
+        try:
+            sink_class = getattr(importlib.import_module(module_name), class_name)
+            sinks.append(sink_class())
+        except Exception as e:
+            logger.error(f"Failed to load alert sink {name}: {str(e)}")
+    return sinks
+
+__all__ = ["AlertSink", "SinkDispatcher", "SINK_TYPES", "load_sinks"]
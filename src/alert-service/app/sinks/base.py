@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from typing import List
+from pydantic import TypeAdapter
+from app.models.alert import Alert
+
+# Serializer shared by the sinks that emit alerts as JSON
+alerts_adapter = TypeAdapter(List[Alert])
+alert_adapter = TypeAdapter(Alert)
+
+class AlertSink(ABC):
+    """Destination that receives batches of alerts"""
+    name = "sink"
+
+    async def start(self):
+        """Open any resources the sink needs"""
+
+    @abstractmethod
+    async def send_many(self, alerts: List[Alert]):
+        """
+        Deliver a batch of alerts
+
+        Args:
+            alerts: Alerts in arrival order
+
+        Raises:
+            Exception: If the batch could not be delivered
+        """
+
+    async def close(self):
+        """Release any resources held by the sink"""
@@ -0,0 +1,91 @@
+import asyncio
+import logging
+from typing import List
+from app.models.alert import Alert
+from .base import AlertSink
+
+logger = logging.getLogger(__name__)
+
+class SinkWorker:
+    """Owns the queue and delivery task of a single sink"""
+
+    def __init__(self, sink: AlertSink, queue_size: int, batch_size: int):
+        self.sink = sink
+        self.batch_size = batch_size
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.task = None
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+
+    def submit(self, alert: Alert):
+        """Queue an alert without waiting, dropping it if the sink is backed up"""
+        try:
+            self.queue.put_nowait(alert)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning(f"Sink {self.sink.name} queue full, dropping alert")
+
+    async def run(self):
+        while True:
+            batch = [await self.queue.get()]
+            while len(batch) < self.batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+
+            try:
+                await self.sink.send_many(batch)
+                self.sent += len(batch)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # A failing sink only loses its own batch
+                self.failed += len(batch)
+                logger.error(f"Sink {self.sink.name} failed to send {len(batch)} alerts: {str(e)}")
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+    def stats(self) -> dict:
+        return {
+            "queued": self.queue.qsize(),
+            "sent": self.sent,
+            "failed": self.failed,
+            "dropped": self.dropped
+        }
+
+class SinkDispatcher:
+    """Fan alerts out to every configured sink through independent workers"""
+
+    def __init__(self, sinks: List[AlertSink], queue_size: int, batch_size: int):
+        self.workers = [SinkWorker(sink, queue_size, batch_size) for sink in sinks]
+
+    async def start(self):
+        for worker in list(self.workers):
+            try:
+                await worker.sink.start()
+            except Exception as e:
+                logger.error(f"Failed to start sink {worker.sink.name}: {str(e)}")
+                self.workers.remove(worker)
+                continue
+            worker.task = asyncio.create_task(worker.run())
+            logger.info(f"Started alert sink: {worker.sink.name}")
+
+    def publish(self, alert: Alert):
+        """Hand an alert to every sink, never blocking the caller"""
+        for worker in self.workers:
+            worker.submit(alert)
+
+    async def close(self, drain_timeout: float = 5.0):
+        """Give the sinks a moment to drain, then stop them"""
+        for worker in self.workers:
+            try:
+                await asyncio.wait_for(worker.queue.join(), timeout=drain_timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Sink {worker.sink.name} did not drain before shutdown")
+            if worker.task:
+                worker.task.cancel()
+                await asyncio.gather(worker.task, return_exceptions=True)
+            await worker.sink.close()
+
+    def stats(self) -> dict:
+        return {worker.sink.name: worker.stats() for worker in self.workers}
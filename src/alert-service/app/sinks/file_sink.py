@@ -0,0 +1,42 @@
+import asyncio
+import os
+import logging
+from logging.handlers import RotatingFileHandler
+from typing import List
+from app.models.alert import Alert
+from app.config import SINK_FILE_PATH, SINK_FILE_MAX_BYTES, SINK_FILE_BACKUP_COUNT
+from .base import AlertSink, alert_adapter
+
+class FileSink(AlertSink):
+    """Append alerts to a size-rotated JSONL file"""
+    name = "file"
+
+    def __init__(self, path: str = SINK_FILE_PATH):
+        self.path = path
+        self.handler = None
+
+    async def start(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.handler = RotatingFileHandler(
+            filename=self.path,
+            maxBytes=SINK_FILE_MAX_BYTES,
+            backupCount=SINK_FILE_BACKUP_COUNT,
+            encoding='utf-8'
+        )
+        self.handler.setFormatter(logging.Formatter('%(message)s'))
+
+    def _write(self, lines: List[str]):
+        for line in lines:
+            self.handler.emit(logging.makeLogRecord({'msg': line}))
+        self.handler.flush()
+
+    async def send_many(self, alerts: List[Alert]):
+        lines = [alert_adapter.dump_json(alert).decode() for alert in alerts]
+        # Disk writes and rotation happen off the event loop
+        await asyncio.to_thread(self._write, lines)
+
+    async def close(self):
+        if self.handler:
+            self.handler.close()
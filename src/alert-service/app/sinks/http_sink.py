@@ -0,0 +1,34 @@
+import aiohttp
+from typing import List
+from app.models.alert import Alert
+from app.config import SINK_HTTP_URL, SINK_HTTP_TIMEOUT
+from .base import AlertSink, alerts_adapter
+
+class HttpSink(AlertSink):
+    """POST alert batches as JSON to a generic HTTP endpoint"""
+    name = "http"
+
+    def __init__(self, url: str = SINK_HTTP_URL):
+        if not url:
+            raise ValueError("SINK_HTTP_URL not configured")
+        self.url = url
+        self.session = None
+
+    async def start(self):
+        self.session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=SINK_HTTP_TIMEOUT)
+        )
+
+    async def send_many(self, alerts: List[Alert]):
+        body = b'{"alerts":' + alerts_adapter.dump_json(alerts) + b'}'
+        async with self.session.post(
+            self.url,
+            data=body,
+            headers={'Content-Type': 'application/json'}
+        ) as response:
+            if response.status >= 300:
+                raise RuntimeError(f"HTTP sink returned status {response.status}")
+
+    async def close(self):
+        if self.session:
+            await self.session.close()
@@ -0,0 +1,42 @@
+import asyncio
+import smtplib
+from email.message import EmailMessage
+from typing import List
+from app.models.alert import Alert
+from app.config import (
+    SINK_SMTP_HOST, SINK_SMTP_PORT, SINK_SMTP_USER, SINK_SMTP_PASSWORD,
+    SINK_SMTP_STARTTLS, SINK_SMTP_FROM, SINK_SMTP_TO
+)
+from .base import AlertSink
+
+class SmtpSink(AlertSink):
+    """Send each alert batch as one email through an SMTP relay"""
+    name = "smtp"
+
+    def __init__(self):
+        if not SINK_SMTP_HOST or not SINK_SMTP_FROM or not SINK_SMTP_TO:
+            raise ValueError("SINK_SMTP_HOST, SINK_SMTP_FROM and SINK_SMTP_TO must be configured")
+
+    def _build_message(self, alerts: List[Alert]) -> EmailMessage:
+        message = EmailMessage()
+        message['From'] = SINK_SMTP_FROM
+        message['To'] = ', '.join(SINK_SMTP_TO)
+        message['Subject'] = f"ARK Alert: {len(alerts)} new event(s)"
+        message.set_content('\n'.join(
+            f"[{alert.timestamp}] {alert.event_type.value} on {alert.map}: "
+            f"{alert.victim} by {alert.perpetrator} ({alert.perpetrator_tribe})"
+            for alert in alerts
+        ))
+        return message
+
+    def _send(self, message: EmailMessage):
+        with smtplib.SMTP(SINK_SMTP_HOST, SINK_SMTP_PORT, timeout=30) as smtp:
+            if SINK_SMTP_STARTTLS:
+                smtp.starttls()
+            if SINK_SMTP_USER:
+                smtp.login(SINK_SMTP_USER, SINK_SMTP_PASSWORD)
+            smtp.send_message(message)
+
+    async def send_many(self, alerts: List[Alert]):
+        # smtplib is blocking, keep it off the event loop
+        await asyncio.to_thread(self._send, self._build_message(alerts))
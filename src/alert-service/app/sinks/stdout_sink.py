@@ -0,0 +1,13 @@
+import sys
+from typing import List
+from app.models.alert import Alert
+from .base import AlertSink, alert_adapter
+
+class StdoutSink(AlertSink):
+    """Write alerts to stdout as JSON lines, useful for testing"""
+    name = "stdout"
+
+    async def send_many(self, alerts: List[Alert]):
+        lines = [alert_adapter.dump_json(alert).decode() for alert in alerts]
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
@@ -0,0 +1,36 @@
+import os
+import time
+
+# Fallback reference when the process start time can't be read from /proc
+IMPORT_STARTED = time.monotonic()
+
+STARTUP_PROFILE = os.getenv('STARTUP_PROFILE', 'false').lower() == 'true'
+
+def process_uptime() -> float:
+    """Seconds since the process was started"""
+    try:
+        with open('/proc/self/stat') as f:
+            start_ticks = int(f.read().rsplit(')', 1)[1].split()[19])
+        with open('/proc/uptime') as f:
+            uptime = float(f.read().split()[0])
+        return uptime - start_ticks / os.sysconf('SC_CLK_TCK')
+    except (OSError, ValueError, IndexError):
+        return time.monotonic() - IMPORT_STARTED
+
+class StartupProfiler:
+    """Records how long after process start each startup phase completed"""
+
+    def __init__(self):
+        self.phases = {}
+
+    def mark(self, phase: str) -> float:
+        """Record a phase once and return its offset in milliseconds"""
+        if phase not in self.phases:
+            self.phases[phase] = round(process_uptime() * 1000, 1)
+        return self.phases[phase]
+
+    def summary(self) -> str:
+        return ', '.join(f"{phase}={ms}ms" for phase, ms in self.phases.items())
+
+profiler = StartupProfiler()
+profiler.mark('interpreter')
@@ -0,0 +1,122 @@
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, Tuple
+from app.models.alert import Alert
+
+# Alert type configurations, overridable per key through ALERT_FORMATS in the config file
+ALERT_FORMATS = {
+    "STRUCTURE_DESTROYED": {
+        "color": 0xFF0000,  # Red
+        "title_emoji": "🚨",
+        "title": "Base Under Attack",
+        "description": "A defensive structure has been destroyed by enemy forces",
+        "victim_emoji": "🏗️",
+        "victim_label": "Structure",
+        "attacker_emoji": "👥",
+        "attacker_label": "Attacker",
+        "tribe_emoji": "⚔️",
+        "tribe_label": "Tribe",
+        "location_emoji": "🗺️",
+        "time_emoji": "⏰"
+    },
+    "MEMBER_KILLED": {
+        "color": 0xFF6B00,  # Orange
+        "title_emoji": "💀",
+        "title": "Tribe Member Down",
+        "description": "A fellow tribe member has fallen in combat",
+        "victim_emoji": "👤",
+        "victim_label": "Member",
+        "attacker_emoji": "🗡️",
+        "attacker_label": "Killer",
+        "tribe_emoji": "⚔️",
+        "tribe_label": "Enemy Tribe",
+        "location_emoji": "🗺️",
+        "time_emoji": "⏰"
+    },
+    "CREATURE_KILLED": {
+        "color": 0xFFFF00,  # Yellow
+        "title_emoji": "🦖",
+        "title": "Creature Lost",
+        "description": "One of your creatures has been killed",
+        "victim_emoji": "🐾",
+        "victim_label": "Creature",
+        "attacker_emoji": "🏹",
+        "attacker_label": "Killer",
+        "tribe_emoji": "⚔️",
+        "tribe_label": "Enemy Tribe",
+        "location_emoji": "🗺️",
+        "time_emoji": "⏰"
+    }
+}
+
+ALERT_FOOTER = "ARK Alert System • Stay vigilant!"
+
+@dataclass(frozen=True)
+class EmbedTemplate:
+    """Discord embed for one event type with every static string resolved up front"""
+    title: str
+    description: str
+    color: int
+    footer: str
+    field_names: Tuple[str, ...]  # Victim, perpetrator, tribe, location, time
+
+    def render(self, alert: Alert, unix_timestamp: int) -> dict:
+        values = (
+            alert.victim,
+            alert.perpetrator,
+            alert.perpetrator_tribe,
+            alert.map,
+            f"<t:{unix_timestamp}:F>"
+        )
+        return {
+            "embeds": [{
+                "title": self.title,
+                "description": self.description,
+                "color": self.color,
+                "fields": [
+                    {"name": name, "value": value, "inline": True}
+                    for name, value in zip(self.field_names, values)
+                ],
+                "footer": {
+                    "text": self.footer
+                }
+            }]
+        }
+
+def compile_template(alert_format: dict, footer: str) -> EmbedTemplate:
+    color = alert_format['color']
+    if isinstance(color, str):
+        color = int(color.lstrip('#'), 16)
+    return EmbedTemplate(
+        title=f"{alert_format['title_emoji']} {alert_format['title']} {alert_format['title_emoji']}",
+        description=alert_format['description'],
+        color=color,
+        footer=footer,
+        field_names=(
+            f"{alert_format['victim_emoji']} {alert_format['victim_label']}",
+            f"{alert_format['attacker_emoji']} {alert_format['attacker_label']}",
+            f"{alert_format['tribe_emoji']} {alert_format['tribe_label']}",
+            f"{alert_format['location_emoji']} Location",
+            f"{alert_format['time_emoji']} Time"
+        )
+    )
+
+def compile_templates(overrides: dict = None, footer: str = ALERT_FOOTER) -> Mapping[str, EmbedTemplate]:
+    """
+    Compile the embed template of every event type
+
+    Args:
+        overrides: Per event type format keys replacing the ALERT_FORMATS defaults
+        footer: Footer text shared by every embed
+
+    Returns:
+        Mapping: Read-only event type to template mapping
+    """
+    overrides = overrides or {}
+    unknown = set(overrides) - set(ALERT_FORMATS)
+    if unknown:
+        raise ValueError(f"Unknown event types in ALERT_FORMATS: {sorted(unknown)}")
+    return MappingProxyType({
+        event_type: compile_template({**alert_format, **overrides.get(event_type, {})}, footer)
+        for event_type, alert_format in ALERT_FORMATS.items()
+    })
@@ -1,11 +1,30 @@
-from fastapi import FastAPI, HTTPException
+# Imported first so the startup profile covers the remaining imports
+from startup import profiler, STARTUP_PROFILE
+from fastapi import FastAPI, HTTPException, Request
 from pydantic import BaseModel
 import logging
-import aiohttp
+import asyncio
 from logging.handlers import TimedRotatingFileHandler
 import os
+from typing import List
+from contextlib import asynccontextmanager
 from processor import LogProcessor
-from config import LOG_LEVEL, LOG_FORMAT, PROCESS_DATA_URL
+from events import LogRecord
+from dispatch import run_batched, shutdown_executor
+from partition import partition_by_map
+from forwarder import OrderedForwarder
+from config import LOG_LEVEL, LOG_FORMAT, live_config
+from config import (
+    BREAKER_FAILURE_THRESHOLD, BREAKER_RESET_TIMEOUT, HTTP_MAX_RETRIES,
+    HTTP_TIMEOUT_MIN, HTTP_TIMEOUT_MAX, HTTP_CONNECT_TIMEOUT, FORWARD_MAX_BATCH
+)
+from resilience import ResilientClient, CircuitOpenError
+from transport import SessionPool
+from template_miner import TemplateMiner
+from config import (
+    MINER_MAX_TEMPLATES, MINER_MAX_SAMPLES, MINER_SIMILARITY, MINER_DEPTH,
+    MINER_MAX_CHILDREN, MINER_SUMMARY_INTERVAL
+)
 
 # Create logs directory if it doesn't exist
 os.makedirs('logs', exist_ok=True)
@@ -46,51 +65,117 @@ class ProcessResponse(BaseModel):
     failed: int
     logs: list
 
-app = FastAPI()
+class ForwardRequest(BaseModel):
+    logs: List[LogRecord]
+
+profiler.mark('imports')
+
+# Shared HTTP sessions (TCP and per Unix socket), built in the lifespan hook
+sessions: SessionPool = None
+
+# One ordered sender per process-data replica, built in the lifespan hook
+forwarder: OrderedForwarder = None
+
+# Circuit breakers and adaptive timeouts per downstream destination
+resilient_client = ResilientClient(
+    failure_threshold=BREAKER_FAILURE_THRESHOLD,
+    reset_timeout=BREAKER_RESET_TIMEOUT,
+    max_retries=HTTP_MAX_RETRIES,
+    min_timeout=HTTP_TIMEOUT_MIN,
+    max_timeout=HTTP_TIMEOUT_MAX,
+    connect_timeout=HTTP_CONNECT_TIMEOUT
+)
+
+# Templates of malformed lines, kept in fixed memory
+template_miner = TemplateMiner(
+    max_templates=MINER_MAX_TEMPLATES,
+    max_samples=MINER_MAX_SAMPLES,
+    similarity=MINER_SIMILARITY,
+    depth=MINER_DEPTH,
+    max_children=MINER_MAX_CHILDREN
+)
+
+def log_unknown_summary():
+    summary = template_miner.summary()
+    if summary:
+        logger.warning(f"Malformed lines since last summary: {summary}")
+
+async def summarize_unknown_periodically():
+    while True:
+        await asyncio.sleep(MINER_SUMMARY_INTERVAL)
+        log_unknown_summary()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global sessions, forwarder
+    sessions = SessionPool()
+    forwarder = OrderedForwarder(forward_logs, FORWARD_MAX_BATCH)
+    config_task = asyncio.create_task(live_config.watch())
+    summary_task = asyncio.create_task(summarize_unknown_periodically())
+    profiler.mark('ready')
+    if STARTUP_PROFILE:
+        logger.info(f"Startup profile: {profiler.summary()}")
+    yield
+    config_task.cancel()
+    summary_task.cancel()
+    log_unknown_summary()
+    await forwarder.close()
+    await sessions.close()
+    shutdown_executor()
+
+app = FastAPI(lifespan=lifespan)
+
+if STARTUP_PROFILE:
+    @app.middleware("http")
+    async def profile_first_request(request: Request, call_next):
+        response = await call_next(request)
+        if 'first_request' not in profiler.phases:
+            profiler.mark('first_request')
+            logger.info(f"Startup profile: {profiler.summary()}")
+        return response
 
 @app.post("/process", response_model=ProcessResponse)
 async def process_log(message: LogMessage):
-    # Process the logs
-    processed_logs = LogProcessor.process_content(message.content)
-    
-    if not processed_logs:
-        logger.warning("No valid logs were processed from the content")
-        return ProcessResponse(
-            status="warning",
-            processed=0,
-            failed=1,
-            logs=[]
-        )
-    
-    # Try to forward to process-data service
+    # Taken on arrival so partitions are queued in the order requests came in
+    ticket = forwarder.ticket()
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                PROCESS_DATA_URL,
-                json={"logs": processed_logs},
-                headers={'Content-Type': 'application/json'},
-                timeout=aiohttp.ClientTimeout(total=10)
-            ) as response:
-                if response.status != 200:
-                    logger.error(f'Error sending to process-data: {response.status}')
-                    # Continue even if process-data fails
-                    return ProcessResponse(
-                        status="partial",
-                        processed=len(processed_logs),
-                        failed=0,
-                        logs=processed_logs
-                    )
-                
-                logger.info(f'Successfully processed and forwarded {len(processed_logs)} logs')
-                return ProcessResponse(
-                    status="success",
-                    processed=len(processed_logs),
-                    failed=0,
-                    logs=processed_logs
-                )
-                
-    except Exception as e:
-        logger.error(f'Error communicating with process-data: {str(e)}')
+        # Process the logs, moving large batches off the event loop
+        try:
+            log_lines = LogProcessor.split_lines(message.content)
+            processed_logs = []
+            for entry in await run_batched(LogProcessor.parse_lines, log_lines):
+                if isinstance(entry, LogRecord):
+                    processed_logs.append(entry)
+                else:
+                    template_miner.add(entry)
+        except Exception as e:
+            logger.error(f"Error processing content: {str(e)}")
+            return ProcessResponse(
+                status="error",
+                processed=0,
+                failed=1,
+                logs=[]
+            )
+        
+        if not processed_logs:
+            logger.warning("No valid logs were processed from the content")
+            return ProcessResponse(
+                status="warning",
+                processed=0,
+                failed=1,
+                logs=[]
+            )
+        
+        # Queue each map partition on the ordered sender of its process-data replica
+        urls = live_config.current.process_data_urls
+        partitions = partition_by_map(processed_logs, len(urls))
+        await ticket.wait()
+        deliveries = [forwarder.submit(urls[index], logs) for index, logs in partitions.items()]
+    finally:
+        ticket.release()
+    results = await asyncio.gather(*deliveries)
+    
+    if not all(results):
         # Return processed logs even if forwarding failed
         return ProcessResponse(
             status="partial",
@@ -98,7 +183,47 @@ async def process_log(message: LogMessage):
             failed=0,
             logs=processed_logs
         )
+    
+    logger.info(f'Successfully processed and forwarded {len(processed_logs)} logs')
+    return ProcessResponse(
+        status="success",
+        processed=len(processed_logs),
+        failed=0,
+        logs=processed_logs
+    )
+
+async def forward_logs(url: str, logs: list) -> bool:
+    """Send logs to one process-data replica, returning whether it accepted them"""
+    try:
+        session, target = sessions.resolve(url)
+        status, _ = await resilient_client.post(
+            session,
+            target,
+            data=ForwardRequest.model_construct(logs=logs).model_dump_json(),
+            headers={'Content-Type': 'application/json'}
+        )
+        if status != 200:
+            logger.error(f'Error sending to process-data at {url}: {status}')
+            return False
+        return True
+            
+    except CircuitOpenError:
+        logger.warning(f'Circuit open for process-data at {url}, not forwarding {len(logs)} logs')
+        return False
+    except Exception as e:
+        logger.error(f'Error communicating with process-data at {url}: {str(e)}')
+        return False
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
\ No newline at end of file
+    return {"status": "healthy", "breakers": resilient_client.stats(), "forward_queues": forwarder.stats()}
+
+@app.get("/templates/unknown")
+async def unknown_templates(limit: int = 20):
+    """Most frequent templates of malformed lines, with a few samples each"""
+    return {"stats": template_miner.stats(), "templates": template_miner.top(limit)}
+
+@app.get("/config/version")
+async def config_version():
+    """Version of the live configuration snapshot"""
+    return live_config.version_info()
@@ -1,5 +1,8 @@
 import os
+from dataclasses import dataclass
+from typing import Tuple
 from dotenv import load_dotenv
+from live_config import ConfigWatcher
 
 # Load environment variables
 load_dotenv()
@@ -8,9 +11,69 @@ load_dotenv()
 API_HOST = os.getenv('API_HOST', '0.0.0.0')
 API_PORT = int(os.getenv('API_PORT', '8000'))
 
-# Process Data Service URL
-PROCESS_DATA_URL = 'http://process-data:8000/process'
+# Process Data Service URL, http(s):// or unix:///path/to/socket.sock/process
+PROCESS_DATA_URL = os.getenv('PROCESS_DATA_URL', 'http://process-data:8000/process')
+
+# Partitioned mode: comma separated process-data replicas. Logs are routed by
+# a hash of their map so every map is always handled, in order, by one replica
+PROCESS_DATA_URLS = [
+    url.strip() for url in os.getenv('PROCESS_DATA_URLS', PROCESS_DATA_URL).split(',') if url.strip()
+]
+
+# Each replica has one sender with a single request in flight, partitions
+# queued meanwhile are merged into its next request, up to this many
+FORWARD_MAX_BATCH = int(os.getenv('FORWARD_MAX_BATCH', '50'))
 
 # Logger Configuration
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
-LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
\ No newline at end of file
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Batch Dispatch Configuration
+# Batches with fewer lines than INLINE_BATCH_LIMIT are parsed on the event loop,
+# larger ones are split into BATCH_CHUNK_SIZE chunks and parsed in a worker pool
+# Kept small: clean-data and process-data usually share a host
+WORKER_POOL_SIZE = int(os.getenv('WORKER_POOL_SIZE', '2'))
+INLINE_BATCH_LIMIT = int(os.getenv('INLINE_BATCH_LIMIT', '200'))
+BATCH_CHUNK_SIZE = int(os.getenv('BATCH_CHUNK_SIZE', '500'))
+
+
+# Resilience Configuration for calls to the next pipeline hop
+BREAKER_FAILURE_THRESHOLD = int(os.getenv('BREAKER_FAILURE_THRESHOLD', '5'))
+BREAKER_RESET_TIMEOUT = float(os.getenv('BREAKER_RESET_TIMEOUT', '30'))
+HTTP_MAX_RETRIES = int(os.getenv('HTTP_MAX_RETRIES', '2'))
+HTTP_TIMEOUT_MIN = float(os.getenv('HTTP_TIMEOUT_MIN', '1'))
+HTTP_TIMEOUT_MAX = float(os.getenv('HTTP_TIMEOUT_MAX', '10'))
+HTTP_CONNECT_TIMEOUT = float(os.getenv('HTTP_CONNECT_TIMEOUT', '2'))
+
+
+# Unknown Line Mining
+# Malformed lines are clustered into templates in fixed memory, exposed on
+# /templates/unknown and logged as a summary every MINER_SUMMARY_INTERVAL seconds
+MINER_MAX_TEMPLATES = int(os.getenv('MINER_MAX_TEMPLATES', '500'))
+MINER_MAX_SAMPLES = int(os.getenv('MINER_MAX_SAMPLES', '3'))
+MINER_SIMILARITY = float(os.getenv('MINER_SIMILARITY', '0.4'))
+MINER_DEPTH = int(os.getenv('MINER_DEPTH', '4'))
+MINER_MAX_CHILDREN = int(os.getenv('MINER_MAX_CHILDREN', '100'))
+MINER_SUMMARY_INTERVAL = float(os.getenv('MINER_SUMMARY_INTERVAL', '300'))
+
+
+# Hot-reloadable Configuration
+# JSON file with overrides keyed like the environment variables above, polled
+# for changes and swapped in without a restart. Reloadable keys: PROCESS_DATA_URLS
+CONFIG_FILE = os.getenv('CONFIG_FILE', 'config/pipeline.json')
+CONFIG_POLL_INTERVAL = float(os.getenv('CONFIG_POLL_INTERVAL', '5'))
+
+@dataclass(frozen=True)
+class LiveConfig:
+    process_data_urls: Tuple[str, ...]
+
+def build_live_config(overrides: dict) -> LiveConfig:
+    urls = overrides.get('PROCESS_DATA_URLS', PROCESS_DATA_URLS)
+    if isinstance(urls, str):
+        urls = urls.split(',')
+    urls = tuple(url.strip() for url in urls if url.strip())
+    if not urls:
+        raise ValueError("PROCESS_DATA_URLS must list at least one url")
+    return LiveConfig(process_data_urls=urls)
+
+live_config = ConfigWatcher(CONFIG_FILE, build_live_config, CONFIG_POLL_INTERVAL)
@@ -0,0 +1,13 @@
+import sys
+from dataclasses import dataclass
+
+@dataclass(slots=True)
+class LogRecord:
+    """A tribe log line split into timestamp, map and message"""
+    timestamp: str
+    map: str
+    message: str
+
+    def __post_init__(self):
+        # Map names repeat on every line, share one string per map
+        self.map = sys.intern(self.map)
@@ -0,0 +1,107 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class ArrivalTicket:
+    """Turn of one request in arrival order, held from arrival until it has queued its logs"""
+
+    def __init__(self, previous: Optional[asyncio.Future]):
+        self.previous = previous
+        self.done = asyncio.get_running_loop().create_future()
+
+    async def wait(self):
+        """Wait until every request that arrived earlier has queued its logs"""
+        if self.previous is not None:
+            await asyncio.shield(self.previous)
+
+    def release(self):
+        if self.previous is not None and not self.previous.done():
+            # Cancelled before its turn, pass it on once the earlier requests are done
+            self.previous.add_done_callback(lambda _: self.release())
+            return
+        if not self.done.done():
+            self.done.set_result(None)
+
+class PartitionSender:
+    """
+    Sole sender for one process-data replica
+
+    Partitions are queued in arrival order and sent with a single request in
+    flight, so a replica always receives a map's logs in the order they came
+    in. Partitions that queue up while a request is in flight are merged into
+    the next one, up to max_batch of them, so throughput does not drop to one
+    request per round trip.
+    """
+
+    def __init__(self, url: str, send: Callable[[str, List], Awaitable[bool]], max_batch: int):
+        self.url = url
+        self.send = send
+        self.max_batch = max_batch
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.task = asyncio.create_task(self._run())
+
+    def submit(self, logs: List) -> asyncio.Future:
+        """Queue logs for the replica, the returned future resolves with whether it accepted them"""
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((logs, future))
+        return future
+
+    async def close(self):
+        self.task.cancel()
+        await asyncio.gather(self.task, return_exceptions=True)
+        while not self.queue.empty():
+            _, future = self.queue.get_nowait()
+            if not future.done():
+                future.set_result(False)
+
+    async def _run(self):
+        while True:
+            batch = [await self.queue.get()]
+            while len(batch) < self.max_batch and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            logs = [log for partition, _ in batch for log in partition]
+            accepted = False
+            try:
+                accepted = await self.send(self.url, logs)
+            except Exception as e:
+                logger.error(f"Error forwarding to process-data at {self.url}: {str(e)}")
+            finally:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_result(accepted)
+
+class OrderedForwarder:
+    """
+    Forwards request partitions to their replicas in request arrival order
+
+    Requests take a ticket when they arrive and queue their partitions only
+    once every earlier request has queued its own, so a large batch parsed in
+    the worker pool is not overtaken by a small one that arrived after it.
+    Each replica URL gets its own PartitionSender, created the first time a
+    reloaded configuration routes logs to it.
+    """
+
+    def __init__(self, send: Callable[[str, List], Awaitable[bool]], max_batch: int):
+        self.send = send
+        self.max_batch = max_batch
+        self.senders: Dict[str, PartitionSender] = {}
+        self.last: Optional[asyncio.Future] = None
+
+    def ticket(self) -> ArrivalTicket:
+        ticket = ArrivalTicket(self.last)
+        self.last = ticket.done
+        return ticket
+
+    def submit(self, url: str, logs: List) -> asyncio.Future:
+        sender = self.senders.get(url)
+        if sender is None:
+            sender = self.senders[url] = PartitionSender(url, self.send, self.max_batch)
+        return sender.submit(logs)
+
+    async def close(self):
+        await asyncio.gather(*(sender.close() for sender in self.senders.values()))
+
+    def stats(self) -> dict:
+        return {url: sender.queue.qsize() for url, sender in self.senders.items()}
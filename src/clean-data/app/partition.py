@@ -0,0 +1,18 @@
+import zlib
+from typing import Dict, List
+
+def partition_index(key: str, partitions: int) -> int:
+    """Stable partition for a key, the same in every process and restart"""
+    return zlib.crc32(key.encode('utf-8')) % partitions
+
+def partition_by_map(logs: List, partitions: int) -> Dict[int, List]:
+    """
+    Group logs by the partition of their map
+
+    Logs keep their relative order inside each partition, so per-map ordering
+    is preserved as long as each partition is delivered in order.
+    """
+    groups: Dict[int, List] = {}
+    for log in logs:
+        groups.setdefault(partition_index(log.map, partitions), []).append(log)
+    return groups
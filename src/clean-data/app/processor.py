@@ -1,18 +1,18 @@
 import re
 from datetime import datetime
 import logging
+from events import LogRecord
 
 logger = logging.getLogger(__name__)
 
 class LogProcessor:
    @staticmethod
-   def extract_log_info(log_line: str) -> dict:
+   def extract_log_info(log_line: str) -> LogRecord:
        try:
            pattern = r'\[(\d{1,2}-\d{1,2}\s\d{1,2}:\d{2}:\d{2})\]\[([^\]]+)\]\s(.+)'
            match = re.match(pattern, log_line)
            
            if not match:
-               logger.error(f"Invalid log format: {log_line}")
                return None
                
            datetime_str, map_name, message = match.groups()
@@ -27,44 +27,25 @@ class LogProcessor:
            
            formatted_date = f"{current_year}-{int(month):02d}-{int(day):02d} {formatted_time}"
            
-           return {
-               "timestamp": formatted_date,
-               "map": map_name.strip(),
-               "message": message.strip()
-           }
+           return LogRecord(
+               timestamp=formatted_date,
+               map=map_name.strip(),
+               message=message.strip()
+           )
        except Exception as e:
-           logger.error(f"Error processing log line: {log_line}")
-           logger.error(f"Error details: {str(e)}")
+           # Malformed lines are mined and summarised by the API, not logged one by one
+           logger.debug(f"Error processing log line: {log_line}, error: {str(e)}")
            return None
 
    @staticmethod
-   def process_content(content: str) -> list:
-       try:
-           content = content.strip('`md\n')
-           content = content.replace('```', '')
-           
-           log_lines = content.strip().split('\n')
-           processed_logs = []
-           failed_logs = []
-           
-           for line in log_lines:
-               line = line.strip()
-               if line:
-                   log_info = LogProcessor.extract_log_info(line)
-                   if log_info:
-                       processed_logs.append(log_info)
-                   else:
-                       failed_logs.append(line)
-           
-           logger.info(f"Successfully processed {len(processed_logs)} logs")
-           if failed_logs:
-               logger.warning(f"Failed to process {len(failed_logs)} logs")
-               for failed_log in failed_logs:
-                   logger.warning(f"Failed log: {failed_log}")
-           
-           return processed_logs
-           
-       except Exception as e:
-           logger.error(f"Error processing content: {str(e)}")
-           logger.error(f"Content that caused error: {content}")
-           return []
\ No newline at end of file
+   def split_lines(content: str) -> list:
+       content = content.strip('`md\n')
+       content = content.replace('```', '')
+       
+       log_lines = content.strip().split('\n')
+       return [line.strip() for line in log_lines if line.strip()]
+
+   @staticmethod
+   def parse_lines(log_lines: list) -> list:
+       """Parse lines in order, keeping the raw line in place of each malformed one"""
+       return [LogProcessor.extract_log_info(line) or line for line in log_lines]
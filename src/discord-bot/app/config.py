@@ -1,5 +1,7 @@
 import os
+from dataclasses import dataclass
 from dotenv import load_dotenv
+from live_config import ConfigWatcher
 
 # Cargar variables de entorno
 load_dotenv()
@@ -7,7 +9,44 @@ load_dotenv()
 # Configuración del Bot
 DISCORD_TOKEN = os.getenv('DISCORD_TOKEN')
 CHANNEL_ID = int(os.getenv('CHANNEL_ID'))  # Canal que monitoreará el bot
-CLEAN_DATA_URL = 'http://clean-data:8000/process'  # URL del servicio clean-data
+CLEAN_DATA_URL = os.getenv('CLEAN_DATA_URL', 'http://clean-data:8000/process')  # URL de clean-data, http(s):// o unix:///ruta/socket.sock/process
 
 # Configuración del logger
-LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
\ No newline at end of file
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+
+# Configuración de deduplicación de líneas
+STATE_DIR = os.getenv('STATE_DIR', 'state')  # Directorio donde se persisten los hashes
+DEDUP_MAX_LINES = int(os.getenv('DEDUP_MAX_LINES', '5000'))  # Hashes recordados por canal
+DEDUP_SAVE_INTERVAL = float(os.getenv('DEDUP_SAVE_INTERVAL', '30'))  # Segundos entre guardados
+
+
+# Modo de gateway ligero: intents mínimos, sin cachés de mensajes ni miembros
+LEAN_GATEWAY = os.getenv('LEAN_GATEWAY', 'true').lower() == 'true'
+
+
+# Configuración de resiliencia para las llamadas a clean-data
+BREAKER_FAILURE_THRESHOLD = int(os.getenv('BREAKER_FAILURE_THRESHOLD', '5'))  # Fallos seguidos antes de abrir el circuito
+BREAKER_RESET_TIMEOUT = float(os.getenv('BREAKER_RESET_TIMEOUT', '30'))  # Segundos con el circuito abierto
+HTTP_MAX_RETRIES = int(os.getenv('HTTP_MAX_RETRIES', '2'))  # Reintentos por petición
+HTTP_TIMEOUT_MIN = float(os.getenv('HTTP_TIMEOUT_MIN', '1'))  # Timeout mínimo en segundos
+HTTP_TIMEOUT_MAX = float(os.getenv('HTTP_TIMEOUT_MAX', '10'))  # Timeout máximo en segundos
+HTTP_CONNECT_TIMEOUT = float(os.getenv('HTTP_CONNECT_TIMEOUT', '2'))  # Timeout de conexión en segundos
+
+
+# Configuración recargable en caliente
+# Archivo JSON con claves como las variables de entorno, se revisa periódicamente
+# y se aplica sin reiniciar el bot. Claves recargables: CHANNEL_ID
+CONFIG_FILE = os.getenv('CONFIG_FILE', 'config/pipeline.json')
+CONFIG_POLL_INTERVAL = float(os.getenv('CONFIG_POLL_INTERVAL', '5'))  # Segundos entre revisiones
+STATUS_PORT = int(os.getenv('STATUS_PORT', '8080'))  # Puerto de /config/version, 0 lo desactiva
+
+@dataclass(frozen=True)
+class LiveConfig:
+    channel_id: int
+    channel_key: str  # channel_id tal como llega en los eventos del gateway
+
+def build_live_config(overrides: dict) -> LiveConfig:
+    channel_id = int(overrides.get('CHANNEL_ID', CHANNEL_ID))
+    return LiveConfig(channel_id=channel_id, channel_key=str(channel_id))
+
+live_config = ConfigWatcher(CONFIG_FILE, build_live_config, CONFIG_POLL_INTERVAL)
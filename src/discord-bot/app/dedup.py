@@ -0,0 +1,107 @@
+import os
+import json
+import hashlib
+import logging
+from collections import Counter, OrderedDict
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+def split_lines(content: str) -> List[str]:
+    """Split a tribe log message into its non-empty lines, dropping code fences"""
+    content = content.replace('```md', '').replace('```', '')
+    return [line.strip() for line in content.split('\n') if line.strip()]
+
+def line_hash(line: str, occurrence: int = 0) -> str:
+    """Hash of the given copy of a line, the first copy hashing the line alone"""
+    if occurrence:
+        line = f'{line}\x00{occurrence}'
+    return hashlib.blake2b(line.encode('utf-8'), digest_size=8).hexdigest()
+
+class LineDeduplicator:
+    """
+    Remembers hashes of the most recent lines seen in each channel
+
+    The feed reposts overlapping windows of the tribe log, so only lines
+    whose hash is not remembered are forwarded. Identical lines are real
+    events too (a raid destroys several walls in the same second), so the
+    n-th copy of a line within a message is hashed with its occurrence
+    number and only copies beyond those already seen are forwarded. Each
+    channel keeps at most
+    max_lines hashes, evicting the least recently seen first, and the set is
+    persisted so a restart does not forward the last window again.
+    """
+
+    def __init__(self, path: str, max_lines: int):
+        self.path = path
+        self.max_lines = max_lines
+        self.channels: Dict[int, OrderedDict] = {}
+        self.forwarded = 0
+        self.suppressed = 0
+        self.dirty = False
+
+    def load(self):
+        """Load persisted hashes, starting empty if the file is missing or corrupt"""
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+            self.channels = {
+                int(channel_id): OrderedDict.fromkeys(hashes[-self.max_lines:])
+                for channel_id, hashes in data.items()
+            }
+            logger.info(f'Loaded line hashes for {len(self.channels)} channel(s)')
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f'Failed to load line hashes from {self.path}: {str(e)}')
+
+    def save(self):
+        """Persist the hashes atomically if anything changed since the last save"""
+        if not self.dirty:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f'{self.path}.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({str(c): list(hashes) for c, hashes in self.channels.items()}, f)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except Exception as e:
+            logger.error(f'Failed to save line hashes to {self.path}: {str(e)}')
+
+    def filter_new(self, channel_id: int, lines: List[str]) -> List[str]:
+        """Return the lines not seen before in the channel and remember them"""
+        seen = self.channels.setdefault(channel_id, OrderedDict())
+        occurrences = Counter()
+        new_lines = []
+        for line in lines:
+            digest = line_hash(line, occurrences[line])
+            occurrences[line] += 1
+            if digest in seen:
+                seen.move_to_end(digest)
+                self.suppressed += 1
+                continue
+            seen[digest] = None
+            new_lines.append(line)
+        self.forwarded += len(new_lines)
+        while len(seen) > self.max_lines:
+            seen.popitem(last=False)
+        self.dirty = True
+        return new_lines
+
+    def forget(self, channel_id: int, lines: List[str]):
+        """Drop lines that failed to forward so a later repost sends them again"""
+        seen = self.channels.get(channel_id, {})
+        for line in lines:
+            # The copies forwarded last are the highest occurrences remembered
+            occurrence = 0
+            while line_hash(line, occurrence + 1) in seen:
+                occurrence += 1
+            seen.pop(line_hash(line, occurrence), None)
+        self.forwarded -= len(lines)
+        self.dirty = True
+
+    def stats(self) -> dict:
+        return {"forwarded": self.forwarded, "suppressed": self.suppressed}
@@ -1,10 +1,21 @@
+# Imported first so the startup profile covers the remaining imports
+from startup import profiler, STARTUP_PROFILE
 import discord
 import logging
 from logging.handlers import TimedRotatingFileHandler
 import aiohttp
-import json
+from aiohttp import web
+import asyncio
 import os
-from config import DISCORD_TOKEN, CHANNEL_ID, CLEAN_DATA_URL, LOG_LEVEL
+from config import (
+    DISCORD_TOKEN, CLEAN_DATA_URL, LOG_LEVEL, STATUS_PORT, live_config,
+    STATE_DIR, DEDUP_MAX_LINES, DEDUP_SAVE_INTERVAL, LEAN_GATEWAY,
+    BREAKER_FAILURE_THRESHOLD, BREAKER_RESET_TIMEOUT, HTTP_MAX_RETRIES,
+    HTTP_TIMEOUT_MIN, HTTP_TIMEOUT_MAX, HTTP_CONNECT_TIMEOUT
+)
+from dedup import LineDeduplicator, split_lines
+from resilience import ResilientClient, CircuitOpenError
+from transport import SessionPool
 
 # Create logs directory if it doesn't exist
 os.makedirs('logs', exist_ok=True)
@@ -38,47 +49,147 @@ def setup_logger():
     return logger
 
 logger = setup_logger()
+profiler.mark('imports')
+
+# Gateway events that carry a channel_id and can be dropped for other channels
+CHANNEL_EVENTS = ('MESSAGE_CREATE', 'MESSAGE_UPDATE', 'MESSAGE_DELETE', 'MESSAGE_DELETE_BULK')
+
+def lean_client_options() -> dict:
+    """Client options for a bot that only reads message content in one channel"""
+    intents = discord.Intents.none()
+    intents.guilds = True
+    intents.guild_messages = True
+    intents.message_content = True
+    return {
+        'intents': intents,
+        'max_messages': None,
+        'member_cache_flags': discord.MemberCacheFlags.none(),
+        'chunk_guilds_at_startup': False
+    }
 
 class WebhookBot(discord.Client):
+    def install_channel_filter(self):
+        """Drop message events for other channels before discord.py builds models for them"""
+        self.events_dropped = 0
+        parsers = self._connection.parsers
+
+        for event in CHANNEL_EVENTS:
+            parse = parsers.get(event)
+            if parse is None:
+                continue
+
+            def filtered(data, parse=parse):
+                if data.get('channel_id') != live_config.current.channel_key:
+                    self.events_dropped += 1
+                    return
+                parse(data)
+
+            parsers[event] = filtered
+
     async def setup_hook(self):
-        self.session = aiohttp.ClientSession()
+        if LEAN_GATEWAY:
+            self.install_channel_filter()
+        self.sessions = SessionPool()
+        self.resilient_client = ResilientClient(
+            failure_threshold=BREAKER_FAILURE_THRESHOLD,
+            reset_timeout=BREAKER_RESET_TIMEOUT,
+            max_retries=HTTP_MAX_RETRIES,
+            min_timeout=HTTP_TIMEOUT_MIN,
+            max_timeout=HTTP_TIMEOUT_MAX,
+            connect_timeout=HTTP_CONNECT_TIMEOUT
+        )
+        self.dedup = LineDeduplicator(os.path.join(STATE_DIR, 'line_hashes.json'), DEDUP_MAX_LINES)
+        self.dedup.load()
+        self.save_task = asyncio.create_task(self.save_dedup_periodically())
+        self.config_task = asyncio.create_task(live_config.watch())
+        self.status_runner = None
+        if STATUS_PORT:
+            await self.start_status_server()
         logger.info('Bot session initialized')
 
+    async def start_status_server(self):
+        """Serve /config/version, the bot has no other HTTP endpoint"""
+        async def config_version(request):
+            return web.json_response(live_config.version_info())
+
+        app = web.Application()
+        app.router.add_get('/config/version', config_version)
+        self.status_runner = web.AppRunner(app, access_log=None)
+        await self.status_runner.setup()
+        await web.TCPSite(self.status_runner, '0.0.0.0', STATUS_PORT).start()
+
+    async def save_dedup_periodically(self):
+        while True:
+            await asyncio.sleep(DEDUP_SAVE_INTERVAL)
+            self.dedup.save()
+
     async def on_ready(self):
         logger.info(f'Bot connected as {self.user.name}')
-        logger.info(f'Monitoring channel ID: {CHANNEL_ID}')
+        logger.info(f'Monitoring channel ID: {live_config.current.channel_id}')
+        profiler.mark('ready')
+        if STARTUP_PROFILE:
+            logger.info(f'Startup profile: {profiler.summary()}')
 
     async def process_message(self, message):
+        # Convert the message to a string format
+        content = message.content if isinstance(message.content, str) else str(message.content)
+        return await self.forward_content(message.channel.id, content)
+
+    async def forward_content(self, channel_id: int, content: str):
+        new_lines = []
         try:
-            # Convert the message to a string format
-            content = message.content if isinstance(message.content, str) else str(message.content)
+            lines = split_lines(content)
+            
+            # Drop lines already forwarded from an overlapping window or from
+            # the version of an edited message
+            new_lines = self.dedup.filter_new(channel_id, lines)
+            stats = self.dedup.stats()
+            logger.info(
+                f'{len(new_lines)} new of {len(lines)} lines '
+                f'(total forwarded={stats["forwarded"]}, suppressed={stats["suppressed"]})'
+            )
+            if not new_lines:
+                return True
             
             webhook_data = {
-                'content': content
+                'content': '\n'.join(new_lines)
             }
             
-            logger.info(f'Sending data to clean-data service: {json.dumps(webhook_data)}')
+            logger.info(f'Sending {len(new_lines)} lines to clean-data service')
             
-            async with self.session.post(
-                CLEAN_DATA_URL,
+            session, target = self.sessions.resolve(CLEAN_DATA_URL)
+            status, response_text = await self.resilient_client.post(
+                session,
+                target,
                 json=webhook_data,
-                headers={'Content-Type': 'application/json'},
-                timeout=aiohttp.ClientTimeout(total=10)
-            ) as response:
-                if response.status != 200:
-                    response_text = await response.text()
-                    logger.error(f'Error from clean-data service. Status: {response.status}, Response: {response_text}')
-                    return False
-                    
-                logger.info('Message forwarded to clean-data service')
-                return True
+                headers={'Content-Type': 'application/json'}
+            )
+            if status != 200:
+                logger.error(f'Error from clean-data service. Status: {status}, Response: {response_text}')
+                self.dedup.forget(channel_id, new_lines)
+                return False
+                
+            logger.info('Message forwarded to clean-data service')
+            return True
                 
-        except aiohttp.ClientConnectorError as e:
+        except CircuitOpenError:
+            logger.warning(f'Circuit open for clean-data service, not forwarding {len(new_lines)} lines')
+            self.dedup.forget(channel_id, new_lines)
+            return False
+        except (aiohttp.ClientConnectorError, aiohttp.ConnectionTimeoutError) as e:
+            # The request never reached clean-data, a later repost may send the lines
             logger.error(f'Connection error to clean-data service: {str(e)}')
+            self.dedup.forget(channel_id, new_lines)
+            return False
+        except asyncio.TimeoutError:
+            # clean-data may still process the request, keep the lines marked as
+            # seen so a later repost does not forward them a second time
+            logger.error(f'Timed out sending {len(new_lines)} lines to clean-data service')
             return False
         except Exception as e:
             logger.error(f'Error sending to clean-data service: {str(e)}')
             logger.error(f'Message content that caused error: {content}')
+            self.dedup.forget(channel_id, new_lines)
             return False
         
     async def on_message(self, message):
@@ -88,7 +199,7 @@ class WebhookBot(discord.Client):
                 return
                 
             # Only process messages from the specified channel
-            if message.channel.id != CHANNEL_ID:
+            if message.channel.id != live_config.current.channel_id:
                 return
             
             # Log the received message
@@ -100,20 +211,62 @@ class WebhookBot(discord.Client):
         except Exception as e:
             logger.error(f'Error processing message: {str(e)}')
 
+    async def on_message_edit(self, before, after):
+        try:
+            if after.author == self.user or after.channel.id != live_config.current.channel_id:
+                return
+            if before.content == after.content:
+                return
+            
+            # The lines that were already there are suppressed by the line hashes
+            logger.info(f'Message edited in channel {after.channel.id}')
+            await self.process_message(after)
+                
+        except Exception as e:
+            logger.error(f'Error processing edited message: {str(e)}')
+
+    async def on_raw_message_edit(self, payload):
+        try:
+            # Without a message cache on_message_edit never fires, use the raw payload
+            if payload.cached_message is not None or payload.channel_id != live_config.current.channel_id:
+                return
+            content = payload.data.get('content')
+            if content is None:
+                return
+            if self.user and payload.data.get('author', {}).get('id') == str(self.user.id):
+                return
+            
+            # The lines that were already there are suppressed by the line hashes
+            logger.info(f'Message edited in channel {payload.channel_id}')
+            await self.forward_content(payload.channel_id, content)
+                
+        except Exception as e:
+            logger.error(f'Error processing edited message: {str(e)}')
+
     async def close(self):
         logger.info('Bot shutting down...')
-        await self.session.close()
+        if hasattr(self, 'save_task'):
+            self.save_task.cancel()
+            self.config_task.cancel()
+            self.dedup.save()
+        if getattr(self, 'status_runner', None):
+            await self.status_runner.cleanup()
+        await self.sessions.close()
         await super().close()
         logger.info('Bot shutdown complete')
 
 def main():
     while True:
         try:
-            intents = discord.Intents.default()
-            intents.message_content = True
+            if LEAN_GATEWAY:
+                options = lean_client_options()
+            else:
+                intents = discord.Intents.default()
+                intents.message_content = True
+                options = {'intents': intents}
             
-            logger.info('Starting Discord bot...')
-            client = WebhookBot(intents=intents)
+            logger.info(f'Starting Discord bot (lean gateway: {LEAN_GATEWAY})...')
+            client = WebhookBot(**options)
             client.run(DISCORD_TOKEN, log_handler=None)
             
         except Exception as e:
@@ -1,12 +1,32 @@
-from fastapi import FastAPI, HTTPException
+# Imported first so the startup profile covers the remaining imports
+from startup import profiler, STARTUP_PROFILE
+from fastapi import FastAPI, HTTPException, Request
 from pydantic import BaseModel
 import logging
+import asyncio
 import aiohttp
+from functools import partial
 from logging.handlers import TimedRotatingFileHandler
 import os
 from typing import List
+from contextlib import asynccontextmanager
 from processor import LogProcessor
-from config import LOG_LEVEL, LOG_FORMAT, ALERT_SERVICE_URL
+from events import Event, LogRecord
+from dispatch import run_batched, shutdown_executor
+from config import LOG_LEVEL, LOG_FORMAT, live_config
+from config import (
+    BREAKER_FAILURE_THRESHOLD, BREAKER_RESET_TIMEOUT, HTTP_MAX_RETRIES,
+    HTTP_TIMEOUT_MIN, HTTP_TIMEOUT_MAX, HTTP_CONNECT_TIMEOUT
+)
+from config import ALERT_BUFFER_SIZE, ALERT_BATCH_SIZE, ALERT_RETRY_INTERVAL
+from resilience import ResilientClient, CircuitOpenError
+from transport import SessionPool
+from outbox import AlertOutbox
+from template_miner import TemplateMiner
+from config import (
+    MINER_MAX_TEMPLATES, MINER_MAX_SAMPLES, MINER_SIMILARITY, MINER_DEPTH,
+    MINER_MAX_CHILDREN, MINER_SUMMARY_INTERVAL
+)
 
 # Create logs directory if it doesn't exist
 os.makedirs('logs', exist_ok=True)
@@ -38,37 +58,105 @@ def setup_logger():
 logger = setup_logger()
 
 # Data models
-class LogEntry(BaseModel):
-    timestamp: str
-    map: str
-    message: str
-
 class LogRequest(BaseModel):
-    logs: List[LogEntry]
+    logs: List[LogRecord]
 
 class ProcessResponse(BaseModel):
     status: str
     processed: int
-    alerts: List[dict]
+    alerts: list
+
+class AlertRequest(BaseModel):
+    alerts: List[Event]
+
+profiler.mark('imports')
+
+# Shared HTTP sessions (TCP and per Unix socket), built in the lifespan hook
+sessions: SessionPool = None
+
+# Alerts held until the alert service accepts them, built in the lifespan hook
+alert_outbox: AlertOutbox = None
+
+# Circuit breakers and adaptive timeouts per downstream destination
+resilient_client = ResilientClient(
+    failure_threshold=BREAKER_FAILURE_THRESHOLD,
+    reset_timeout=BREAKER_RESET_TIMEOUT,
+    max_retries=HTTP_MAX_RETRIES,
+    min_timeout=HTTP_TIMEOUT_MIN,
+    max_timeout=HTTP_TIMEOUT_MAX,
+    connect_timeout=HTTP_CONNECT_TIMEOUT
+)
+
+# Templates of logs that match no known event format, kept in fixed memory
+template_miner = TemplateMiner(
+    max_templates=MINER_MAX_TEMPLATES,
+    max_samples=MINER_MAX_SAMPLES,
+    similarity=MINER_SIMILARITY,
+    depth=MINER_DEPTH,
+    max_children=MINER_MAX_CHILDREN
+)
+
+def log_unknown_summary():
+    summary = template_miner.summary()
+    if summary:
+        logger.warning(f"Unclassified logs since last summary: {summary}")
+
+async def summarize_unknown_periodically():
+    while True:
+        await asyncio.sleep(MINER_SUMMARY_INTERVAL)
+        log_unknown_summary()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global sessions, alert_outbox
+    sessions = SessionPool()
+    alert_outbox = AlertOutbox(send_alerts, ALERT_BUFFER_SIZE, ALERT_BATCH_SIZE, ALERT_RETRY_INTERVAL)
+    alert_outbox.start()
+    config_task = asyncio.create_task(live_config.watch())
+    summary_task = asyncio.create_task(summarize_unknown_periodically())
+    profiler.mark('ready')
+    if STARTUP_PROFILE:
+        logger.info(f"Startup profile: {profiler.summary()}")
+    yield
+    config_task.cancel()
+    summary_task.cancel()
+    log_unknown_summary()
+    await alert_outbox.close()
+    await sessions.close()
+    shutdown_executor()
+
+app = FastAPI(lifespan=lifespan)
 
-app = FastAPI()
+if STARTUP_PROFILE:
+    @app.middleware("http")
+    async def profile_first_request(request: Request, call_next):
+        response = await call_next(request)
+        if 'first_request' not in profiler.phases:
+            profiler.mark('first_request')
+            logger.info(f"Startup profile: {profiler.summary()}")
+        return response
 
 @app.post("/process", response_model=ProcessResponse)
 async def process_logs(request: LogRequest):
+    # Process the logs with one config snapshot, moving large batches off the event loop
+    config = live_config.current
     processed_alerts = []
+    try:
+        results = await run_batched(
+            partial(LogProcessor.classify_logs, ignored_tribes=config.ignored_tribes),
+            request.logs
+        )
+    except Exception as e:
+        logger.error(f"Error classifying {len(request.logs)} logs: {str(e)}")
+        raise HTTPException(status_code=500, detail="Log classification failed")
+    for result in results:
+        if isinstance(result, Event):
+            processed_alerts.append(result)
+        else:
+            template_miner.add(result)
     
-    for log in request.logs:
-        try:
-            # Process each log
-            result = LogProcessor.process_log(log.dict())
-            if result:
-                processed_alerts.append(result)
-                logger.info(f"Processed alert: {result}")
-                
-        except Exception as e:
-            logger.error(f"Error processing log: {str(e)}")
-            logger.error(f"Problematic log: {log}")
-            continue
+    for result in processed_alerts:
+        logger.info(f"Processed alert: {result}")
     
     if not processed_alerts:
         return ProcessResponse(
@@ -77,18 +165,8 @@ async def process_logs(request: LogRequest):
             alerts=[]
         )
     
-    try:
-        # Send alerts to alert service
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                ALERT_SERVICE_URL,
-                json={"alerts": processed_alerts},
-                headers={'Content-Type': 'application/json'}
-            ) as response:
-                if response.status != 200:
-                    logger.error(f'Error sending to alert service: {response.status}')
-    except Exception as e:
-        logger.error(f'Error communicating with alert service: {str(e)}')
+    # Sent in the background, held while the alert service cannot take them
+    alert_outbox.add(processed_alerts)
     
     return ProcessResponse(
         status="success",
@@ -96,6 +174,47 @@ async def process_logs(request: LogRequest):
         alerts=processed_alerts
     )
 
+async def send_alerts(alerts: list) -> bool:
+    """Send a batch to the alert service, returning False if it should be retried later"""
+    try:
+        session, target = sessions.resolve(live_config.current.alert_service_url)
+        status, response_text = await resilient_client.post(
+            session,
+            target,
+            data=AlertRequest.model_construct(alerts=alerts).model_dump_json(),
+            headers={'Content-Type': 'application/json'}
+        )
+        if status >= 500:
+            logger.error(f'Error sending to alert service: {status}, holding {len(alerts)} alerts')
+            return False
+        if status not in (200, 202):
+            # Rejected as invalid, sending it again would not help
+            logger.error(f'Alert service rejected {len(alerts)} alerts: {status} {response_text}')
+        return True
+    except CircuitOpenError:
+        logger.warning(f'Circuit open for alert service, holding {len(alerts)} alerts')
+        return False
+    except aiohttp.ConnectionTimeoutError:
+        logger.error(f'Timed out connecting to alert service, holding {len(alerts)} alerts')
+        return False
+    except asyncio.TimeoutError:
+        # The alert service may still have queued them, resending could duplicate alerts
+        logger.error(f'Timed out sending {len(alerts)} alerts to alert service')
+        return True
+    except Exception as e:
+        logger.error(f'Error communicating with alert service: {str(e)}, holding {len(alerts)} alerts')
+        return False
+
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
\ No newline at end of file
+    return {"status": "healthy", "breakers": resilient_client.stats(), "alert_outbox": alert_outbox.stats()}
+
+@app.get("/templates/unknown")
+async def unknown_templates(limit: int = 20):
+    """Most frequent templates of unclassified logs, with a few samples each"""
+    return {"stats": template_miner.stats(), "templates": template_miner.top(limit)}
+
+@app.get("/config/version")
+async def config_version():
+    """Version of the live configuration snapshot"""
+    return live_config.version_info()
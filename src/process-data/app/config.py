@@ -1,15 +1,81 @@
 import os
+from dataclasses import dataclass
+from typing import FrozenSet
 from dotenv import load_dotenv
+from live_config import ConfigWatcher
 
 # Load environment variables
 load_dotenv()
 
-# Alert Service Configuration
+# Alert Service URL, http(s):// or unix:///path/to/socket.sock/alert
 ALERT_SERVICE_URL = os.getenv('ALERT_SERVICE_URL', 'http://alert-service:8000/alert')
 
-# Tribe to ignore
+# Tribe to ignore, a single name (the config file can list several)
 IGNORED_TRIBE = os.getenv('IGNORED_TRIBE', '')
 
+# Batch Dispatch Configuration
+# Batches with fewer logs than INLINE_BATCH_LIMIT are classified on the event loop,
+# larger ones are split into BATCH_CHUNK_SIZE chunks and classified in a worker pool
+# Kept small: clean-data and process-data usually share a host
+WORKER_POOL_SIZE = int(os.getenv('WORKER_POOL_SIZE', '2'))
+INLINE_BATCH_LIMIT = int(os.getenv('INLINE_BATCH_LIMIT', '200'))
+BATCH_CHUNK_SIZE = int(os.getenv('BATCH_CHUNK_SIZE', '500'))
+
 # Logger Configuration
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
-LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
\ No newline at end of file
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Resilience Configuration for calls to the next pipeline hop
+BREAKER_FAILURE_THRESHOLD = int(os.getenv('BREAKER_FAILURE_THRESHOLD', '5'))
+BREAKER_RESET_TIMEOUT = float(os.getenv('BREAKER_RESET_TIMEOUT', '30'))
+HTTP_MAX_RETRIES = int(os.getenv('HTTP_MAX_RETRIES', '2'))
+HTTP_TIMEOUT_MIN = float(os.getenv('HTTP_TIMEOUT_MIN', '1'))
+HTTP_TIMEOUT_MAX = float(os.getenv('HTTP_TIMEOUT_MAX', '10'))
+HTTP_CONNECT_TIMEOUT = float(os.getenv('HTTP_CONNECT_TIMEOUT', '2'))
+
+# Alert Outbox
+# Alerts are sent to the alert service by one background sender in batches of
+# ALERT_BATCH_SIZE. While it cannot take them they are held and retried every
+# ALERT_RETRY_INTERVAL seconds, dropping the oldest beyond ALERT_BUFFER_SIZE
+ALERT_BUFFER_SIZE = int(os.getenv('ALERT_BUFFER_SIZE', '10000'))
+ALERT_BATCH_SIZE = int(os.getenv('ALERT_BATCH_SIZE', '100'))
+ALERT_RETRY_INTERVAL = float(os.getenv('ALERT_RETRY_INTERVAL', '2'))
+
+
+# Unknown Log Mining
+# Logs that match no known event format are clustered into templates in fixed
+# memory, exposed on /templates/unknown and logged as a summary every
+# MINER_SUMMARY_INTERVAL seconds
+MINER_MAX_TEMPLATES = int(os.getenv('MINER_MAX_TEMPLATES', '500'))
+MINER_MAX_SAMPLES = int(os.getenv('MINER_MAX_SAMPLES', '3'))
+MINER_SIMILARITY = float(os.getenv('MINER_SIMILARITY', '0.4'))
+MINER_DEPTH = int(os.getenv('MINER_DEPTH', '4'))
+MINER_MAX_CHILDREN = int(os.getenv('MINER_MAX_CHILDREN', '100'))
+MINER_SUMMARY_INTERVAL = float(os.getenv('MINER_SUMMARY_INTERVAL', '300'))
+
+
+# Hot-reloadable Configuration
+# JSON file with overrides keyed like the environment variables above, polled
+# for changes and swapped in without a restart.
+# Reloadable keys: ALERT_SERVICE_URL, IGNORED_TRIBE (one name, or a JSON array of names)
+CONFIG_FILE = os.getenv('CONFIG_FILE', 'config/pipeline.json')
+CONFIG_POLL_INTERVAL = float(os.getenv('CONFIG_POLL_INTERVAL', '5'))
+
+@dataclass(frozen=True)
+class LiveConfig:
+    alert_service_url: str
+    ignored_tribes: FrozenSet[str]  # Lowercased, matched against the perpetrator tribe
+
+def build_live_config(overrides: dict) -> LiveConfig:
+    tribes = overrides.get('IGNORED_TRIBE', IGNORED_TRIBE)
+    if isinstance(tribes, str):
+        # A string is one tribe name, even if it contains commas
+        tribes = [tribes]
+    elif not isinstance(tribes, list):
+        raise ValueError("IGNORED_TRIBE must be a tribe name or a list of names")
+    return LiveConfig(
+        alert_service_url=overrides.get('ALERT_SERVICE_URL', ALERT_SERVICE_URL),
+        ignored_tribes=frozenset(tribe.strip().lower() for tribe in tribes if tribe.strip())
+    )
+
+live_config = ConfigWatcher(CONFIG_FILE, build_live_config, CONFIG_POLL_INTERVAL)
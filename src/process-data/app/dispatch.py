@@ -0,0 +1,93 @@
+import asyncio
+import sys
+import logging
+from concurrent.futures import BrokenExecutor, Executor
+from typing import Callable, List, Optional
+from config import WORKER_POOL_SIZE, INLINE_BATCH_LIMIT, BATCH_CHUNK_SIZE
+
+logger = logging.getLogger(__name__)
+
+_executor: Optional[Executor] = None
+
+def gil_disabled() -> bool:
+    """Check if the interpreter is a free-threaded build running without the GIL"""
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+def get_executor() -> Executor:
+    """Return the shared worker pool, creating it on first use"""
+    global _executor
+    if _executor is None:
+        # Deferred so services that never see a large batch skip the import
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+        if gil_disabled():
+            _executor = ThreadPoolExecutor(max_workers=WORKER_POOL_SIZE)
+        else:
+            # The pool starts while serving, when the process already runs threads
+            # (asyncio's resolver pool), so workers must not be forked from it
+            method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            _executor = ProcessPoolExecutor(
+                max_workers=WORKER_POOL_SIZE,
+                mp_context=multiprocessing.get_context(method)
+            )
+        logger.info(f"Started {type(_executor).__name__} with {WORKER_POOL_SIZE} workers")
+    return _executor
+
+def discard_executor():
+    """Drop a broken worker pool so the next batch starts a fresh one"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+def shutdown_executor():
+    """Stop the worker pool if it was started"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+
+async def run_batched(
+    func: Callable[[list], list],
+    items: list,
+    inline_limit: int = INLINE_BATCH_LIMIT,
+    chunk_size: int = BATCH_CHUNK_SIZE
+) -> List:
+    """
+    Apply a list-to-list function to a batch without blocking the event loop
+
+    Small batches run inline. Large batches are split into chunks that run in
+    the worker pool, and the results are merged back in the original order.
+    If a worker dies (e.g. OOM-killed) the broken pool is replaced and the
+    batch retried once, then run inline if the new pool breaks too.
+
+    Args:
+        func: Picklable function taking a list of items and returning a list of results
+        items: Items to process
+        inline_limit: Batches smaller than this run on the event loop
+        chunk_size: Number of items sent to a worker at a time
+
+    Returns:
+        list: Concatenated results of every chunk, in input order
+    """
+    if len(items) < inline_limit:
+        return func(items)
+
+    loop = asyncio.get_running_loop()
+    chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+    for attempt in range(2):
+        executor = get_executor()
+        try:
+            results = await asyncio.gather(
+                *(loop.run_in_executor(executor, func, chunk) for chunk in chunks)
+            )
+            return [result for chunk_result in results for result in chunk_result]
+        except BrokenExecutor as e:
+            logger.error(f"Worker pool broken, restarting it: {str(e)}")
+            # Another batch may already have replaced it
+            if _executor is executor:
+                discard_executor()
+
+    logger.error(f"Worker pool broken again, processing {len(items)} items inline")
+    return func(items)
@@ -0,0 +1,34 @@
+import sys
+from dataclasses import dataclass
+from enum import Enum
+
+class EventType(str, Enum):
+    """Types of game events that can trigger alerts"""
+    STRUCTURE_DESTROYED = "STRUCTURE_DESTROYED"
+    MEMBER_KILLED = "MEMBER_KILLED"
+    CREATURE_KILLED = "CREATURE_KILLED"
+
+@dataclass(slots=True)
+class LogRecord:
+    """A tribe log line split into timestamp, map and message"""
+    timestamp: str
+    map: str
+    message: str
+
+    def __post_init__(self):
+        # Map names repeat on every line, share one string per map
+        self.map = sys.intern(self.map)
+
+@dataclass(slots=True)
+class Event:
+    """A classified game event ready to be sent as an alert"""
+    event_type: EventType
+    timestamp: str
+    map: str
+    victim: str
+    perpetrator: str
+    perpetrator_tribe: str
+
+    def __post_init__(self):
+        self.map = sys.intern(self.map)
+        self.perpetrator_tribe = sys.intern(self.perpetrator_tribe)
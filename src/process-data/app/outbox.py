@@ -0,0 +1,88 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Awaitable, Callable, List
+
+logger = logging.getLogger(__name__)
+
+class AlertOutbox:
+    """
+    Alerts waiting to be sent to the alert service
+
+    A single background sender posts them in batches of batch_size, in the
+    order they were classified. When a batch cannot be delivered (the
+    circuit is open, the alert service is down or answers 5xx) it is put
+    back and retried every retry_interval seconds instead of being dropped.
+    At most max_size alerts are held, dropping the oldest beyond that.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[List], Awaitable[bool]],
+        max_size: int,
+        batch_size: int,
+        retry_interval: float
+    ):
+        self.send = send
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.retry_interval = retry_interval
+        self.alerts: deque = deque()
+        self.ready = asyncio.Event()
+        self.dropped = 0
+        self.task = None
+
+    def start(self):
+        self.task = asyncio.create_task(self._run())
+
+    def add(self, alerts: List):
+        self.alerts.extend(alerts)
+        self._trim()
+        self.ready.set()
+
+    def _trim(self):
+        overflow = len(self.alerts) - self.max_size
+        if overflow > 0:
+            for _ in range(overflow):
+                self.alerts.popleft()
+            self.dropped += overflow
+            logger.error(f"Alert outbox full, dropped the {overflow} oldest alerts")
+
+    def _take(self) -> List:
+        return [self.alerts.popleft() for _ in range(min(self.batch_size, len(self.alerts)))]
+
+    def _put_back(self, batch: List):
+        self.alerts.extendleft(reversed(batch))
+        self._trim()
+
+    async def _run(self):
+        while True:
+            if not self.alerts:
+                self.ready.clear()
+                await self.ready.wait()
+                continue
+            batch = self._take()
+            try:
+                delivered = await self.send(batch)
+            except asyncio.CancelledError:
+                self._put_back(batch)
+                raise
+            if not delivered:
+                self._put_back(batch)
+                await asyncio.sleep(self.retry_interval)
+
+    async def close(self):
+        """Stop the sender and make a last attempt to deliver what is held"""
+        if self.task:
+            self.task.cancel()
+            await asyncio.gather(self.task, return_exceptions=True)
+        while self.alerts:
+            batch = self._take()
+            if not await self.send(batch):
+                self._put_back(batch)
+                break
+        if self.alerts:
+            logger.error(f"Shutting down with {len(self.alerts)} undelivered alerts")
+
+    def stats(self) -> dict:
+        return {"queued": len(self.alerts), "dropped": self.dropped}
@@ -1,14 +1,15 @@
 import re
 import logging
-from config import IGNORED_TRIBE
+from typing import FrozenSet, Optional
+from events import Event, EventType, LogRecord
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
 class LogProcessor:
     @staticmethod
-    def adjust_timestamp(timestamp: str) -> str:
-        """Adjust timestamp by adding 3 hours"""
+    def adjust_timestamp(timestamp: str) -> Optional[str]:
+        """Adjust timestamp by adding 3 hours, None if it cannot be parsed"""
         try:
             # Parse the timestamp
             dt = datetime.strptime(timestamp, '%Y-%m-%d %H:%M:%S')
@@ -18,7 +19,7 @@ class LogProcessor:
             return adjusted_dt.strftime('%Y-%m-%d %H:%M:%S')
         except Exception as e:
             logger.error(f"Error adjusting timestamp: {str(e)}, timestamp: {timestamp}")
-            return timestamp
+            return None
 
     @staticmethod
     def extract_creature_type(text: str) -> str:
@@ -26,14 +27,14 @@ class LogProcessor:
         return match.group(1) if match else None
 
     @staticmethod
-    def should_ignore_tribe(tribe: str) -> bool:
-        """Check if the tribe should be ignored based on IGNORED_TRIBE config"""
-        if not IGNORED_TRIBE or not tribe:
-            logger.info(f"No ignore check: IGNORED_TRIBE='{IGNORED_TRIBE}', event_tribe='{tribe}'")
+    def should_ignore_tribe(tribe: str, ignored_tribes: FrozenSet[str]) -> bool:
+        """Check if the tribe should be ignored based on the IGNORED_TRIBE rule set"""
+        if not ignored_tribes or not tribe:
+            logger.info(f"No ignore check: ignored_tribes={sorted(ignored_tribes)}, event_tribe='{tribe}'")
             return False
         
-        should_ignore = tribe.lower() == IGNORED_TRIBE.lower()
-        logger.info(f"Checking ignore: IGNORED_TRIBE='{IGNORED_TRIBE}', event_tribe='{tribe}', should_ignore={should_ignore}")
+        should_ignore = tribe.lower() in ignored_tribes
+        logger.info(f"Checking ignore: ignored_tribes={sorted(ignored_tribes)}, event_tribe='{tribe}', should_ignore={should_ignore}")
         return should_ignore
 
     @staticmethod
@@ -53,7 +54,7 @@ class LogProcessor:
                 creature, tribe = matches
                 return f"{name} ({creature})", tribe
                 
-            logger.warning(f"Unexpected format in killer text: {killer_text}")
+            logger.debug(f"Unexpected format in killer text: {killer_text}")
             return None, None
                 
         except Exception as e:
@@ -75,10 +76,21 @@ class LogProcessor:
         return victim.strip("'")
 
     @staticmethod
-    def process_log(log: dict) -> dict:
-        message = log['message']
+    def classify_log(log: LogRecord, ignored_tribes: FrozenSet[str] = frozenset()):
+        """
+        Classify a log into an event
+
+        Returns:
+            Event for a recognised event, None when it comes from an ignored
+            tribe, or the message itself when no known format matches it
+        """
+        message = log.message
         # Adjust timestamp before processing
-        adjusted_timestamp = LogProcessor.adjust_timestamp(log['timestamp'])
+        adjusted_timestamp = LogProcessor.adjust_timestamp(log.timestamp)
+        if adjusted_timestamp is None:
+            # The alert service rejects the whole batch over one bad timestamp,
+            # so such a log never becomes an event and is mined instead
+            return message
         
         if 'destroyed your' in message:
             match = re.search(r'(.*?) destroyed your \'([^\']+)\'', message)
@@ -86,20 +98,20 @@ class LogProcessor:
                 killer, structure = match.groups()
                 killer_name, tribe = LogProcessor.process_killer_info(killer)
                 if not killer_name or not tribe:
-                    return None
+                    return message
                     
-                if LogProcessor.should_ignore_tribe(tribe):
+                if LogProcessor.should_ignore_tribe(tribe, ignored_tribes):
                     logger.info(f"Ignoring log from ignored tribe: {tribe}")
                     return None
                     
-                return {
-                    "event_type": "STRUCTURE_DESTROYED",
-                    "timestamp": adjusted_timestamp,
-                    "map": log['map'],
-                    "victim": structure,
-                    "perpetrator": killer_name,
-                    "perpetrator_tribe": tribe
-                }
+                return Event(
+                    event_type=EventType.STRUCTURE_DESTROYED,
+                    timestamp=adjusted_timestamp,
+                    map=log.map,
+                    victim=structure,
+                    perpetrator=killer_name,
+                    perpetrator_tribe=tribe
+                )
 
         elif 'Tribemember' in message and 'was killed by' in message:
             match = re.search(r'Tribemember (.*?) was killed by (.*?)!', message)
@@ -107,20 +119,20 @@ class LogProcessor:
                 victim, killer = match.groups()
                 killer_name, tribe = LogProcessor.process_killer_info(killer)
                 if not killer_name or not tribe:
-                    return None
+                    return message
                     
-                if LogProcessor.should_ignore_tribe(tribe):
+                if LogProcessor.should_ignore_tribe(tribe, ignored_tribes):
                     logger.info(f"Ignoring log from ignored tribe: {tribe}")
                     return None
                     
-                return {
-                    "event_type": "MEMBER_KILLED",
-                    "timestamp": adjusted_timestamp,
-                    "map": log['map'],
-                    "victim": LogProcessor.process_victim_info(victim),
-                    "perpetrator": killer_name,
-                    "perpetrator_tribe": tribe
-                }
+                return Event(
+                    event_type=EventType.MEMBER_KILLED,
+                    timestamp=adjusted_timestamp,
+                    map=log.map,
+                    victim=LogProcessor.process_victim_info(victim),
+                    perpetrator=killer_name,
+                    perpetrator_tribe=tribe
+                )
 
         elif 'Your' in message and 'was killed by' in message:
             match = re.search(r'Your (.*?) was killed by (.*?)!', message)
@@ -128,19 +140,41 @@ class LogProcessor:
                 victim, killer = match.groups()
                 killer_name, tribe = LogProcessor.process_killer_info(killer)
                 if not killer_name or not tribe:
-                    return None
+                    return message
                     
-                if LogProcessor.should_ignore_tribe(tribe):
+                if LogProcessor.should_ignore_tribe(tribe, ignored_tribes):
                     logger.info(f"Ignoring log from ignored tribe: {tribe}")
                     return None
                     
-                return {
-                    "event_type": "CREATURE_KILLED",
-                    "timestamp": adjusted_timestamp,
-                    "map": log['map'],
-                    "victim": LogProcessor.process_victim_info(victim),
-                    "perpetrator": killer_name,
-                    "perpetrator_tribe": tribe
-                }
+                return Event(
+                    event_type=EventType.CREATURE_KILLED,
+                    timestamp=adjusted_timestamp,
+                    map=log.map,
+                    victim=LogProcessor.process_victim_info(victim),
+                    perpetrator=killer_name,
+                    perpetrator_tribe=tribe
+                )
                 
-        return None
\ No newline at end of file
+        return message
+
+    @staticmethod
+    def classify_logs(logs: list, ignored_tribes: FrozenSet[str] = frozenset()) -> list:
+        """
+        Classify a batch of logs in input order
+
+        Returns:
+            list: An Event per recognised log and the message of every log no
+            format matched, logs from ignored tribes are left out
+        """
+        results = []
+        for log in logs:
+            try:
+                result = LogProcessor.classify_log(log, ignored_tribes)
+                if result is not None:
+                    results.append(result)
+                    
+            except Exception as e:
+                # Unparseable logs are mined and summarised by the API, not logged one by one
+                logger.debug(f"Error processing log: {str(e)}, log: {log}")
+                results.append(str(getattr(log, 'message', log)))
+        return results
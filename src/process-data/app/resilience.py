@@ -0,0 +1,191 @@
+import asyncio
+import random
+import time
+import logging
+from collections import deque
+from typing import Dict, Tuple
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a destination whose circuit is open"""
+
+class CircuitBreaker:
+    """
+    Per-destination circuit breaker
+
+    closed: requests flow, consecutive failures are counted.
+    open: requests fail fast until reset_timeout has passed.
+    half_open: a single probe request is let through, its outcome closes or
+    re-opens the circuit.
+    """
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+
+    def allow(self) -> bool:
+        if self.state == "open":
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            self._transition("half_open")
+        if self.state == "half_open":
+            if self.probing:
+                return False
+            self.probing = True
+        return True
+
+    def record_success(self):
+        self.failures = 0
+        self.probing = False
+        if self.state != "closed":
+            self._transition("closed")
+
+    def record_failure(self):
+        self.failures += 1
+        self.probing = False
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+            if self.state != "open":
+                self._transition("open")
+
+    def _transition(self, state: str):
+        logger.warning(f"Circuit for {self.name} changed from {self.state} to {state}")
+        self.state = state
+
+class LatencyTracker:
+    """Recent successful latencies, used to derive a timeout from the observed p99"""
+
+    def __init__(self, min_timeout: float, max_timeout: float, multiplier: float, window: int = 200):
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.multiplier = multiplier
+        self.samples: deque = deque(maxlen=window)
+
+    def record(self, seconds: float):
+        self.samples.append(seconds)
+
+    def p99(self) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(0.99 * len(ordered)))]
+
+    def timeout(self) -> float:
+        # Stay at the ceiling until there are enough samples to trust the p99
+        if len(self.samples) < 20:
+            return self.max_timeout
+        return min(self.max_timeout, max(self.min_timeout, self.p99() * self.multiplier))
+
+class ResilientClient:
+    """
+    POST helper shared by the pipeline hops
+
+    Every destination URL gets its own circuit breaker and latency tracker.
+    Requests fail fast while a circuit is open. Failures to connect, which
+    happen before the request is sent, and 502/503/504 responses are retried a
+    bounded number of times with full-jitter exponential backoff, and the call
+    counts as a single breaker failure once they are exhausted. Timeouts and
+    connections dropped after connecting are not retried because the
+    downstream may already be processing the request.
+    """
+
+    RETRY_STATUSES = (502, 503, 504)
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        max_retries: int = 2,
+        backoff_base: float = 0.2,
+        min_timeout: float = 1.0,
+        max_timeout: float = 10.0,
+        timeout_multiplier: float = 3.0,
+        connect_timeout: float = 2.0
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.timeout_multiplier = timeout_multiplier
+        self.connect_timeout = connect_timeout
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.latencies: Dict[str, LatencyTracker] = {}
+
+    def _destination(self, url: str) -> Tuple[CircuitBreaker, LatencyTracker]:
+        if url not in self.breakers:
+            self.breakers[url] = CircuitBreaker(url, self.failure_threshold, self.reset_timeout)
+            self.latencies[url] = LatencyTracker(self.min_timeout, self.max_timeout, self.timeout_multiplier)
+        return self.breakers[url], self.latencies[url]
+
+    async def post(self, session: aiohttp.ClientSession, url: str, **kwargs) -> Tuple[int, str]:
+        """
+        POST to a destination through its circuit breaker
+
+        Returns:
+            tuple: Response status and body text
+
+        Raises:
+            CircuitOpenError: If the destination's circuit is open
+            Exception: The last error once retries are exhausted
+        """
+        breaker, latency = self._destination(url)
+        if not breaker.allow():
+            raise CircuitOpenError(f"Circuit open for {url}")
+
+        # Retries belong to one call, which counts as a single breaker failure
+        attempt = 0
+        try:
+            while True:
+                started = time.monotonic()
+                try:
+                    # A separate connect timeout raises ConnectionTimeoutError, telling
+                    # a request never sent apart from one the downstream may have
+                    total = latency.timeout()
+                    async with session.post(
+                        url,
+                        timeout=aiohttp.ClientTimeout(total=total, connect=min(total, self.connect_timeout)),
+                        **kwargs
+                    ) as response:
+                        body = await response.text()
+                        status = response.status
+                except (aiohttp.ClientConnectorError, aiohttp.ConnectionTimeoutError):
+                    if attempt >= self.max_retries:
+                        raise
+                else:
+                    if status < 500:
+                        breaker.record_success()
+                        latency.record(time.monotonic() - started)
+                        return status, body
+                    if status not in self.RETRY_STATUSES or attempt >= self.max_retries:
+                        breaker.record_failure()
+                        return status, body
+
+                attempt += 1
+                await asyncio.sleep(random.uniform(0, self.backoff_base * 2 ** attempt))
+        except asyncio.CancelledError:
+            # Free the half-open probe slot for the next caller
+            breaker.probing = False
+            raise
+        except Exception:
+            breaker.record_failure()
+            raise
+
+    def stats(self) -> dict:
+        return {
+            url: {
+                "state": breaker.state,
+                "consecutive_failures": breaker.failures,
+                "timeout_s": round(self.latencies[url].timeout(), 3),
+                "p99_ms": round(self.latencies[url].p99() * 1000, 1)
+            }
+            for url, breaker in self.breakers.items()
+        }
@@ -0,0 +1,183 @@
+import re
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+WILDCARD = '<*>'
+HAS_DIGIT = re.compile(r'\d')
+
+class Template:
+    """One cluster of similar lines: its template tokens, counts and a few sample lines"""
+    __slots__ = ('id', 'tokens', 'count', 'window_count', 'samples', 'first_seen', 'last_seen', 'path')
+
+    def __init__(self, template_id: int, tokens: List[str], path: list):
+        self.id = template_id
+        self.tokens = tokens
+        self.count = 0
+        self.window_count = 0
+        self.samples: List[str] = []
+        self.first_seen = time.time()
+        self.last_seen = self.first_seen
+        self.path = path  # (node, key) pairs from the root down to the leaf
+
+    @property
+    def text(self) -> str:
+        return ' '.join(self.tokens)
+
+    def to_dict(self) -> dict:
+        return {
+            "template": self.text,
+            "count": self.count,
+            "samples": self.samples,
+            "first_seen": self.first_seen,
+            "last_seen": self.last_seen
+        }
+
+class TemplateMiner:
+    """
+    Bounded Drain-style clustering of log lines into templates
+
+    Lines are tokenized on whitespace, with tokens containing digits masked as
+    wildcards, and routed through a fixed-depth prefix tree: first by token
+    count, then by their first tokens, where nodes past max_children fall into
+    a wildcard branch. Within a leaf a line joins the template sharing the most
+    constant tokens, whose differing positions become wildcards, or starts a
+    new one when fewer than `similarity` of its tokens match. At most
+    max_templates templates are kept, evicting the least frequent first, and
+    each keeps only max_samples sample lines, so memory stays fixed however
+    many lines arrive.
+    """
+
+    def __init__(
+        self,
+        max_templates: int = 500,
+        max_samples: int = 3,
+        similarity: float = 0.4,
+        depth: int = 4,
+        max_children: int = 100,
+        max_tokens: int = 40,
+        max_sample_length: int = 300
+    ):
+        self.max_templates = max_templates
+        self.max_samples = max_samples
+        self.similarity = similarity
+        self.depth = max(depth, 3)
+        self.max_children = max_children
+        self.max_tokens = max_tokens
+        self.max_sample_length = max_sample_length
+        self.root: Dict = {}
+        self.templates: 'OrderedDict[int, Template]' = OrderedDict()
+        self.next_id = 0
+        self.lines = 0
+        self.window_lines = 0
+        self.evicted = 0
+
+    def _tokenize(self, line: str) -> List[str]:
+        # Tokens with digits are ids, levels and coordinates, mask them up front
+        tokens = [WILDCARD if HAS_DIGIT.search(token) else token for token in line.split()]
+        if len(tokens) > self.max_tokens:
+            tokens = tokens[:self.max_tokens - 1] + [WILDCARD]
+        return tokens
+
+    def _path(self, tokens: List[str]) -> list:
+        """Walk the prefix tree to the leaf of a line, creating missing nodes"""
+        path = [(self.root, len(tokens))]
+        node = self.root.setdefault(len(tokens), {})
+        for token in tokens[:self.depth - 2]:
+            key = token
+            if key not in node and len(node) >= self.max_children:
+                key = WILDCARD
+            path.append((node, key))
+            node = node.setdefault(key, {})
+        path.append((node, None))
+        node.setdefault(None, [])
+        return path
+
+    def _similarity(self, template: List[str], tokens: List[str]) -> tuple:
+        # Only constant template tokens count, ties go to the more general template
+        same = sum(1 for a, b in zip(template, tokens) if a == b and a != WILDCARD)
+        wildcards = template.count(WILDCARD)
+        return same / len(tokens), wildcards
+
+    def add(self, line: str) -> Optional[Template]:
+        """Assign a line to its template, returning the template"""
+        tokens = self._tokenize(line)
+        if not tokens:
+            return None
+        path = self._path(tokens)
+        node, key = path[-1]
+        leaf = node[key]
+
+        best, best_score = None, (-1.0, 0)
+        for template in leaf:
+            score = self._similarity(template.tokens, tokens)
+            if score > best_score:
+                best, best_score = template, score
+
+        if best is None or best_score[0] < self.similarity:
+            if len(self.templates) >= self.max_templates:
+                self._evict()
+                # Eviction may have pruned this line's branch
+                path = self._path(tokens)
+            best = Template(self.next_id, tokens, path)
+            self.next_id += 1
+            self.templates[best.id] = best
+            node, key = path[-1]
+            node[key].append(best)
+        else:
+            best.tokens = [a if a == b else WILDCARD for a, b in zip(best.tokens, tokens)]
+            self.templates.move_to_end(best.id)
+
+        best.count += 1
+        best.window_count += 1
+        best.last_seen = time.time()
+        if len(best.samples) < self.max_samples:
+            best.samples.append(line[:self.max_sample_length])
+        self.lines += 1
+        self.window_lines += 1
+        return best
+
+    def _evict(self):
+        # Lowest count first, least recently seen among equals, so a flood of
+        # one-off lines cannot push out the frequent templates
+        template = min(self.templates.values(), key=lambda t: t.count)
+        del self.templates[template.id]
+        node, key = template.path[-1]
+        node[key].remove(template)
+        # Drop the branches left empty so the tree stays bounded as well
+        for node, key in reversed(template.path):
+            if node[key]:
+                break
+            del node[key]
+        self.evicted += 1
+
+    def top(self, limit: int = 20) -> List[dict]:
+        """Templates with the most lines, most frequent first"""
+        ranked = sorted(self.templates.values(), key=lambda t: t.count, reverse=True)
+        return [template.to_dict() for template in ranked[:limit]]
+
+    def summary(self, limit: int = 5) -> Optional[str]:
+        """
+        Describe the lines mined since the previous summary and start a new window
+
+        Returns:
+            str: One line summary, or None if no line arrived in the window
+        """
+        if not self.window_lines:
+            return None
+        active = [t for t in self.templates.values() if t.window_count]
+        active.sort(key=lambda t: t.window_count, reverse=True)
+        top = '; '.join(f"{t.window_count}x {t.text}" for t in active[:limit])
+        text = f"{self.window_lines} lines in {len(active)} templates, top: {top}"
+        for template in active:
+            template.window_count = 0
+        self.window_lines = 0
+        return text
+
+    def stats(self) -> dict:
+        return {
+            "lines": self.lines,
+            "templates": len(self.templates),
+            "max_templates": self.max_templates,
+            "evicted": self.evicted
+        }
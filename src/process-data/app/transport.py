@@ -0,0 +1,69 @@
+import os
+import re
+from typing import Dict, Optional, Tuple
+import aiohttp
+
+UNIX_SCHEME = 'unix://'
+UNIX_LOCATION = re.compile(r'(/.*?\.sock)(/.*)?$')
+
+def split_unix_url(url: str) -> Tuple[Optional[str], str]:
+    """
+    Split a pipeline URL into its Unix socket path and the HTTP URL to request
+
+    Unix socket URLs name the socket file followed by the request path, e.g.
+    unix:///run/pipeline/process-data.sock/process. The socket path ends at
+    the first segment ending in ".sock". The HTTP URL uses the socket name as
+    host so every socket keeps its own circuit breaker.
+
+    Returns:
+        tuple: Socket path, or None for TCP URLs, and the HTTP URL
+    """
+    if not url.startswith(UNIX_SCHEME):
+        return None, url
+
+    location = url[len(UNIX_SCHEME):]
+    match = UNIX_LOCATION.match(location)
+    if not match:
+        raise ValueError(f"Unix socket URL must name an absolute .sock path: {url}")
+    socket_path, request_path = match.group(1), match.group(2) or '/'
+    host = os.path.basename(socket_path)[:-len('.sock')]
+    return socket_path, f'http://{host}{request_path}'
+
+class SessionPool:
+    """
+    aiohttp sessions for TCP and Unix socket destinations
+
+    TCP URLs share one session. Each Unix socket gets its own session with a
+    UnixConnector, created the first time a URL for it is requested, so
+    reloaded configurations can switch a hop between transports.
+    """
+
+    def __init__(self):
+        self.tcp: Optional[aiohttp.ClientSession] = None
+        self.unix: Dict[str, aiohttp.ClientSession] = {}
+
+    def resolve(self, url: str) -> Tuple[aiohttp.ClientSession, str]:
+        """
+        Pick the session for a URL
+
+        Returns:
+            tuple: Session to use and the HTTP URL to request through it
+        """
+        socket_path, http_url = split_unix_url(url)
+        if socket_path is None:
+            if self.tcp is None:
+                self.tcp = aiohttp.ClientSession()
+            return self.tcp, http_url
+
+        session = self.unix.get(socket_path)
+        if session is None:
+            session = self.unix[socket_path] = aiohttp.ClientSession(
+                connector=aiohttp.UnixConnector(path=socket_path)
+            )
+        return session, http_url
+
+    async def close(self):
+        if self.tcp is not None:
+            await self.tcp.close()
+        for session in self.unix.values():
+            await session.close()